@@ -0,0 +1,201 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import string
+import sys
+import time
+import tracemalloc
+
+# the package prints a banner on import, keep stdout for JSON lines only
+with contextlib.redirect_stdout(sys.stderr):
+    from montecarlo.mcs import Die, Game, Analyzer
+
+
+###################
+# BENCHMARK SETUP #
+###################
+
+
+# operations timed for each configuration, in the order they are run; cached
+# operations time a repeated call served from the cache, the others time
+# computing from scratch
+OPERATIONS = ['roll_die', 'play_game', 'show_results_narrow', 'jackpot_counts',
+              'face_counts', 'combo_counts', 'permutations',
+              'show_results_narrow_cached', 'combo_counts_cached']
+
+
+def make_game(dice, faces, seed=0):
+    """
+    Create a Game of fair letter dice.
+
+    Parameters
+    ----------
+    dice : int
+        Number of dice in the game.
+    faces : int
+        Number of faces on each die, lettered from A.
+    seed : int, optional
+        Seed for the game. The default is 0.
+
+    Returns
+    -------
+    game : Game object
+        Game with the given number of identical dice.
+    """
+
+    letters = np.array(list(string.ascii_uppercase[:faces]))
+    game = Game([Die(letters) for _ in range(dice)], seed=seed)
+
+    return game
+
+
+def operation(name, game, rolls):
+    """
+    Get a callable that runs one benchmarked operation.
+
+    Parameters
+    ----------
+    name : str
+        One of OPERATIONS.
+    game : Game object
+        Game to run the operation on, already played for analysis steps.
+    rolls : int
+        Number of rolls in the configuration.
+
+    Returns
+    -------
+    func : callable
+        Function with no arguments running the operation.
+    """
+
+    def uncached_narrow():
+        # drop the narrow form cached since the last play so it is rebuilt
+        game._narrow = None
+        return game.show_results('narrow')
+
+    # a new Analyzer per call starts with an empty cache
+    analyzer = Analyzer(game)
+    funcs = {'roll_die': lambda: game.dice[0].roll_die(rolls),
+             'play_game': lambda: game.play_game(rolls),
+             'show_results_narrow': uncached_narrow,
+             'jackpot_counts': lambda: Analyzer(game).jackpot_counts(),
+             'face_counts': lambda: Analyzer(game).face_counts(),
+             'combo_counts': lambda: Analyzer(game).combo_counts(),
+             'permutations': lambda: Analyzer(game).permutations(),
+             'show_results_narrow_cached': lambda: game.show_results('narrow'),
+             'combo_counts_cached': lambda: analyzer.combo_counts(copy=False)}
+
+    return funcs[name]
+
+
+def measure(func, repeat):
+    """
+    Time a callable and record its peak traced memory.
+
+    Parameters
+    ----------
+    func : callable
+        Function with no arguments to measure.
+    repeat : int
+        Number of timed runs, the fastest is reported.
+
+    Returns
+    -------
+    seconds : float
+        Fastest wall time of the timed runs.
+    peak_bytes : int
+        Peak memory allocated during one extra traced run.
+    """
+
+    # time without tracing so tracemalloc overhead is not included
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # trace a separate run for peak memory (numpy and python allocations)
+    tracemalloc.start()
+    func()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return min(times), peak_bytes
+
+
+def run(rolls_list, dice_list, faces_list, operations, repeat, max_cells):
+    """
+    Benchmark every operation for each combination of rolls, dice and faces.
+
+    Parameters
+    ----------
+    rolls_list, dice_list, faces_list : list
+        Values swept for number of rolls, dice and faces.
+    operations : list
+        Names of operations to time.
+    repeat : int
+        Number of timed runs per measurement.
+    max_cells : int
+        Configurations whose rolls times max(dice, faces) exceeds this
+        are skipped.
+
+    Yields
+    ------
+    record : dict
+        One measurement with its configuration and environment.
+    """
+
+    env = {'python': platform.python_version(), 'numpy': np.__version__,
+           'pandas': pd.__version__, 'machine': platform.machine()}
+
+    for rolls, dice, faces in itertools.product(rolls_list, dice_list, faces_list):
+        if rolls * max(dice, faces) > max_cells:
+            continue
+
+        # analysis steps need results from a played game
+        game = make_game(dice, faces)
+        game.play_game(rolls)
+
+        for name in operations:
+            seconds, peak_bytes = measure(operation(name, game, rolls), repeat)
+            yield {'operation': name, 'rolls': rolls, 'dice': dice, 'faces': faces,
+                   'seconds': seconds, 'peak_bytes': peak_bytes,
+                   'timestamp': time.time(), **env}
+
+
+def main():
+    """
+    Run the benchmark suite from the command line and write JSON lines.
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark Die, Game and Analyzer.')
+    parser.add_argument('--rolls', type=int, nargs='+',
+                        default=[10**3, 10**4, 10**5, 10**6, 10**7])
+    parser.add_argument('--dice', type=int, nargs='+', default=[1, 2, 5, 10, 20])
+    parser.add_argument('--faces', type=int, nargs='+', default=[2, 6, 26])
+    parser.add_argument('--operations', nargs='+', default=OPERATIONS, choices=OPERATIONS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-cells', type=int, default=10**8)
+    parser.add_argument('--output', default='-',
+                        help='JSON lines file to append to, "-" for stdout.')
+    args = parser.parse_args()
+
+    records = run(args.rolls, args.dice, args.faces, args.operations,
+                  args.repeat, args.max_cells)
+
+    # append one JSON object per line so runs can be tracked over time
+    out = None if args.output == '-' else open(args.output, 'a')
+    try:
+        for record in records:
+            print(json.dumps(record), file=out, flush=True)
+    finally:
+        if out is not None:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
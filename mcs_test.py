@@ -1,7 +1,14 @@
-from montecarlo.mcs import Die, Game, Analyzer
+from montecarlo.mcs import Die, Game, Analyzer, RunningAnalyzer, SketchAnalyzer, ExactAnalyzer, Experiment, Profiler
 import pandas as pd
 import numpy as np
 import unittest
+import warnings
+import unittest.mock
+import asyncio
+import tempfile
+import os
+import subprocess
+import sys
 
 
 ##################
@@ -90,6 +97,95 @@ class DieTestSuite(unittest.TestCase):
         self.assertEqual(obj_str, test_str)
 
 
+    def test_18_die_alias_cache(self):
+        """
+        Test change_weights() clears the cached alias table used by roll_die().
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3]))
+        d1.roll_die(5)
+        cached = d1._alias
+        
+        # create test variables
+        d1.change_weights(1, 0)
+        d1.change_weights(2, 0)
+        roll_results = d1.roll_die(50)
+        
+        # create assert method
+        self.assertIsNotNone(cached)
+        self.assertIsNot(d1._alias, cached)
+        self.assertEqual(set(roll_results), {3})
+        d1.change_weights(1, -1)
+        with self.assertRaises(ValueError):
+            d1.roll_die(5)
+
+
+    def test_34_die_update_weights(self):
+        """
+        Test update_weights() sets many weights at once from mapping or array.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','C']))
+        d1.update_weights({'A': 2, 'C': '0.5'})
+        d2 = Die(np.array(['A','B','C']))
+        d2.update_weights([3, 0, 1])
+        
+        # create test variables
+        test_weights = [2., 1., 0.5]
+        
+        # create assert method
+        self.assertEqual(d1.weights.tolist(), test_weights)
+        self.assertEqual(d1.show_state()['weights'].tolist(), test_weights)
+        self.assertEqual(d2.weights.tolist(), [3., 0., 1.])
+        with self.assertRaises(IndexError):
+            d1.update_weights({'Z': 1})
+        with self.assertRaises(TypeError):
+            d1.update_weights({'A': 'heavy'})
+        with self.assertRaises(ValueError):
+            d1.update_weights({'A': 5, 'B': -1})
+        with self.assertRaises(ValueError):
+            d1.update_weights(2.0)
+        self.assertEqual(d1.weights.tolist(), test_weights)
+    
+    
+    def test_35_die_from_frequencies(self):
+        """
+        Test from_frequencies() reads faces and weights from a file.
+        """
+        # create test objects
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'letters.txt')
+            with open(path, 'w') as f:
+                f.write('E 12\nT 9\nQ 1')
+            d1 = Die.from_frequencies(path)
+        
+        # create test variables
+        test_faces = ['E', 'T', 'Q']
+        test_weights = [12., 9., 1.]
+        
+        # create assert method
+        self.assertEqual(d1.faces.tolist(), test_faces)
+        self.assertEqual(d1.weights.tolist(), test_weights)
+
+
+    def test_36_die_no_pandas_import(self):
+        """
+        Test creating and rolling dice does not import pandas.
+        """
+        # create test objects
+        code = ('import sys, numpy as np; from montecarlo.mcs import Die, Game; '
+                'g = Game([Die(np.array([1,2,3]))]); g.play_game(10); '
+                'print("pandas" in sys.modules)')
+        
+        # create test variables
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        
+        # create assert method
+        self.assertEqual(output.stdout.split()[-1], 'False')
+        self.assertFalse(hasattr(Die(np.array([1,2])), '__dict__'))
+
+
 ###################
 # GAME CLASS TEST #
 ###################
@@ -173,6 +269,235 @@ class GameTestSuite(unittest.TestCase):
         self.assertEqual(obj_str, test_str)
 
 
+    def test_16_game_play_game_seed(self):
+        """
+        Test play_game with the same seed gives the same wide results.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3,4,5,6]))
+        d2 = Die(np.array([1,2,3,4,5,6]))
+        d2.change_weights(6, 0)
+        
+        g1 = Game([d1,d2], seed=42)
+        g2 = Game([d1,d2], seed=42)
+        
+        # create test variables
+        g1.play_game(100)
+        g2.play_game(100)
+        results = g1.show_results()
+        
+        # create assert method
+        self.assertEqual(results.shape, (100, 2))
+        self.assertTrue(results.equals(g2.show_results()))
+        self.assertNotIn(6, results[2].tolist())
+
+
+    def test_17_game_results_codes(self):
+        """
+        Test results are stored as compact face indices and decoded on show.
+        """
+        # create test objects
+        faces = np.array(['A','B','C'])
+        d1 = Die(faces)
+        d2 = Die(faces)
+        
+        g1 = Game([d1,d2])
+        g1.play_game(10)
+        
+        # create test variables
+        codes = g1._game_results
+        results = g1.show_results()
+        
+        # create assert method
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertIsInstance(results[1].dtype, pd.CategoricalDtype)
+        self.assertEqual(results.to_numpy().tolist(), faces[codes].tolist())
+
+
+    def test_19_game_play_game_workers(self):
+        """
+        Test parallel play_game gives the same results for any number of workers.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3,4,5,6]))
+        d2 = Die(np.array([1,2,3,4,5,6]))
+        
+        g1 = Game([d1,d2], seed=7)
+        g2 = Game([d1,d2], seed=7)
+        
+        # create test variables
+        g1.play_game(25, workers=1, chunk_size=10)
+        g2.play_game(25, workers=2, chunk_size=10)
+        
+        # create assert method
+        self.assertEqual(g1.show_results().shape, (25, 2))
+        self.assertTrue(np.array_equal(g1._game_results, g2._game_results))
+
+
+    def test_27_game_store(self):
+        """
+        Test results written to a store can be reopened without replaying.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','C']))
+        d2 = Die(np.array(['A','B','C']))
+        d2.change_weights('C', 3)
+        g1 = Game([d1,d2])
+        
+        # create test variables
+        with tempfile.TemporaryDirectory() as tmp:
+            g1.play_game(25, chunk_size=10, store=tmp)
+            g2 = Game.from_store(tmp)
+            results = g2.show_results()
+            weights = g2.dice[1].weights.tolist()
+            with unittest.mock.patch.object(Analyzer, 'CHUNK_SIZE', 7):
+                combos = Analyzer(g2).combo_counts()
+            g3 = Game([d1,d2])
+            g3._game_results = np.array(g2._game_results)
+            test_combos = Analyzer(g3).combo_counts()
+            old_results = g2.show_results(copy=False)
+            g1.play_game(5, store=tmp)
+            old_codes = old_results[1].array.codes.tolist()
+            new_rolls = g1.show_results().shape[0]
+            del g1, g2, old_results
+        
+        # create assert method
+        self.assertEqual(results.shape, (25, 2))
+        self.assertEqual(weights, [1., 1., 3.])
+        self.assertTrue(combos.equals(test_combos))
+        self.assertEqual(len(old_codes), 25)
+        self.assertEqual(new_rolls, 5)
+
+
+    def test_28_game_show_results_views(self):
+        """
+        Test narrow results are cached until next play and match wide results.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3]))
+        d2 = Die(np.array([1,2,3]))
+        g1 = Game([d1,d2])
+        g1.play_game(6)
+        
+        # create test variables
+        wide = g1.show_results(copy=False)
+        narrow = g1.show_results('narrow', copy=False)
+        cached = g1.show_results('narrow', copy=False)
+        g1.play_game(4)
+        replayed = g1.show_results('narrow', copy=False)
+        
+        # create assert method
+        self.assertIs(narrow, cached)
+        self.assertEqual(narrow.index.names, ['roll', 'die'])
+        self.assertEqual(narrow.loc[(3, 2), 'value'], wide.loc[3, 2])
+        self.assertEqual(replayed.shape, (8, 1))
+
+
+    def test_33_game_play_game_sampling(self):
+        """
+        Test importance sampled jackpots estimate the exact rare jackpot count.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3,4]))
+        d2 = Die(np.array([1,2,3,4]))
+        d3 = Die(np.array([1,2,3,4]))
+        for d in [d1,d2,d3]:
+            d.change_weights(4, 0.1)
+        g1 = Game([d1,d2,d3], seed=2)
+        
+        # create test variables
+        g1.play_game(20000, sampling='importance', proposal=np.array([1,1,1,3]))
+        counts = Analyzer(g1).jackpot_counts(by_face=True, weighted=True)
+        test_counts = 20000 * (0.1 / 3.1) ** 3
+        g1.play_game(100, sampling='stratified')
+        strata = g1.show_results()[1].value_counts().sort_index().to_numpy()
+        test_strata = 100 * d1.weights / d1.weights.sum()
+        
+        # create assert method
+        self.assertAlmostEqual(counts.loc[4, 'count'] / test_counts, 1, delta=0.1)
+        self.assertTrue((np.abs(strata - test_strata) <= 1).all())
+        with self.assertRaises(ValueError):
+            g1.play_game(10, sampling='importance', proposal=np.array([1,1,1,0]))
+        with self.assertRaises(ValueError):
+            g1.play_game(10, sampling='importance', proposal=np.array([-1,1,1,1]))
+        g2 = Game([Die(np.array([1,2,3,4,5,6])), Die(np.array([1,2,3]))], seed=2)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            g2.play_game(20000, sampling='importance', proposal=np.array([1,1,1,1,1,5]))
+        mixed = Analyzer(g2).jackpot_counts(weighted=True)
+        self.assertAlmostEqual(mixed / ExactAnalyzer(g2).jackpot_counts(), 1, delta=0.1)
+        self.assertTrue((g2._likelihood[g2._game_results[:, 1] == 5] == 0).all())
+
+    def test_37_game_mixed_dice(self):
+        """
+        Test a game of dice with different faces maps rolls onto shared faces.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3,4,5,6]))
+        d2 = Die(np.array([20,1,5]))
+        g1 = Game([d1,d2], seed=3)
+        
+        # create test variables
+        g1.play_game(1000)
+        results = g1.show_results()
+        jackpots = Analyzer(g1).jackpot_counts(by_face=True)
+        test_faces = [1,2,3,4,5,6,20]
+        
+        # create assert method
+        self.assertEqual(list(g1._faces), test_faces)
+        self.assertTrue(results[2].isin([20,1,5]).all())
+        self.assertEqual(set(jackpots.index[jackpots['count'] > 0]), {1,5})
+        self.assertAlmostEqual(ExactAnalyzer(g1).jackpot_counts(), 1000 * 2 / 18)
+        g2 = Game([Die(np.array([1,2,3])), Die(np.array(['1','b']))], seed=3)
+        g2.play_game(20)
+        self.assertEqual(g2._faces.tolist(), [1,2,3,'1','b'])
+        self.assertTrue(g2.show_results()[1].isin([1,2,3]).all())
+
+    def test_39_game_counter_based_replay(self):
+        """
+        Test counter-based games replay any range of rolls and match with workers.
+        """
+        # create test objects
+        g1 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=4, counter_based=True)
+        g2 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=4, counter_based=True)
+        
+        # create test variables
+        g1.play_game(250, chunk_size=100)
+        g2.play_game(250, workers=1, chunk_size=100)
+        results = g1.show_results()
+        replayed = g1.replay(95, 210)
+        test_rolls = [Die(np.array([1,2,3]), seed=2).roll_die(5) for _ in range(2)]
+        
+        # create assert method
+        self.assertTrue(replayed.equals(results.iloc[95:210]))
+        self.assertTrue(g2.show_results().equals(results))
+        self.assertEqual(test_rolls[0], test_rolls[1])
+        with self.assertRaises(ValueError):
+            Game([Die(np.array([1,2,3]))]).replay(0, 1)
+        g1.play_game(10, sampling='antithetic')
+        with self.assertRaises(ValueError):
+            g1.replay(0, 10)
+
+    def test_40_game_aplay(self):
+        """
+        Test aplay() yields the same chunks as iter_play() to async code.
+        """
+        # create test objects
+        g1 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=6)
+        g2 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=6)
+        
+        async def collect():
+            return [codes async for codes in g1.aplay(250, chunk_size=100)]
+        
+        # create test variables
+        chunks = asyncio.run(collect())
+        test_chunks = list(g2.iter_play(250, chunk_size=100))
+        
+        # create assert method
+        self.assertEqual([c.shape[0] for c in chunks], [100, 100, 50])
+        self.assertTrue(all(np.array_equal(c, t) for c, t in zip(chunks, test_chunks)))
+
+
 #######################
 # ANALYZER CLASS TEST #
 #######################
@@ -295,6 +620,400 @@ class AnalyzerTestSuite(unittest.TestCase):
         self.assertEqual(obj_str, test_str)
 
 
+    def test_22_analyzer_face_counts_forms(self):
+        """
+        Test face_counts() total and sparse forms agree with the wide form.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','C']))
+        d2 = Die(np.array(['A','B','C']))
+        g1 = Game([d1,d2])
+        g1.play_game(20)
+        
+        # create test variables
+        a1 = Analyzer(g1)
+        wide = a1.face_counts()
+        total = a1.face_counts('total')
+        sparse = a1.face_counts('sparse')
+        
+        # create assert method
+        self.assertEqual(wide.sum(axis=1).tolist(), [2] * 20)
+        self.assertEqual(total['count'].tolist(), wide.sum().tolist())
+        self.assertTrue(sparse.sparse.to_dense().equals(wide))
+        self.assertTrue((sparse.dtypes == pd.SparseDtype("int64", 0)).all())
+        with self.assertRaises(ValueError):
+            a1.face_counts('long')
+
+
+    def test_23_analyzer_combo_perm_counts(self):
+        """
+        Test combo_counts() and permutations() count every roll once.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','C']))
+        d2 = Die(np.array(['A','B','C']))
+        g1 = Game([d1,d2])
+        g1.play_game(50)
+        
+        # create test variables
+        a1 = Analyzer(g1)
+        combos = a1.combo_counts()
+        perms = a1.permutations()
+        rolls = g1.show_results().to_numpy().tolist()
+        test_perm = tuple(rolls[0])
+        test_combo = tuple(sorted(rolls[0]))
+        
+        # create assert method
+        self.assertEqual(combos['count'].sum(), 50)
+        self.assertEqual(perms['count'].sum(), 50)
+        self.assertEqual(perms.loc[test_perm, 'count'], rolls.count(list(test_perm)))
+        self.assertIn(test_combo, combos.index)
+        self.assertTrue(perms['count'].is_monotonic_decreasing)
+        g2 = Game([Die(np.array([6,5,4,3,2,1])), Die(np.array([6,5,4,3,2,1]))])
+        g2.play_game(100)
+        self.assertTrue(all(a <= b for a, b in Analyzer(g2).combo_counts().index))
+        self.assertTrue(all(a <= b for a, b in ExactAnalyzer(g2).combo_counts().index))
+
+
+    def test_24_analyzer_jackpot_rolls(self):
+        """
+        Test jackpot_counts() by face and jackpot roll numbers agree with results.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2]))
+        d2 = Die(np.array([1,2]))
+        d3 = Die(np.array([1,2]))
+        g1 = Game([d1,d2,d3])
+        g1.play_game(40)
+        
+        # create test variables
+        a1 = Analyzer(g1)
+        by_face, rolls = a1.jackpot_counts(by_face=True, return_rolls=True)
+        results = g1.show_results().astype(int)
+        test_rolls = results.index[results.nunique(axis=1) == 1].tolist()
+        
+        # create assert method
+        self.assertEqual(rolls.tolist(), test_rolls)
+        self.assertEqual(by_face['count'].sum(), a1.jackpot_counts())
+        self.assertEqual(by_face.loc[1, 'count'], (results.loc[test_rolls, 1] == 1).sum())
+
+
+    def test_25_analyzer_cache(self):
+        """
+        Test statistics are reused until the game is played again.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3]))
+        d2 = Die(np.array([1,2,3]))
+        g1 = Game([d1,d2])
+        g1.play_game(30)
+        a1 = Analyzer(g1)
+        
+        # create test variables
+        perms = a1.permutations()
+        perms['count'] = 0
+        cached_perms = a1.permutations()
+        g1.play_game(10)
+        new_perms = a1.permutations()
+        
+        # create assert method
+        self.assertEqual(cached_perms['count'].sum(), 30)
+        self.assertEqual(len(a1._cache), 1)
+        self.assertEqual(new_perms['count'].sum(), 10)
+        self.assertFalse(g1._results_view().flags.writeable)
+        self.assertIs(a1.permutations(copy=False), a1.permutations(copy=False))
+
+
+    def test_26_analyzer_vocabulary_matches(self):
+        """
+        Test vocabulary_matches() counts permutations that spell listed words.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','T']))
+        d2 = Die(np.array(['A','B','T']))
+        g1 = Game([d1,d2])
+        g1.play_game(200)
+        a1 = Analyzer(g1)
+        
+        # create test variables
+        with tempfile.TemporaryDirectory() as tmp:
+            vocab_path = os.path.join(tmp, 'words.txt')
+            with open(vocab_path, 'w') as f:
+                f.write('AT\nTA\nBAT\nAB\n')
+            matches = a1.vocabulary_matches(vocab_path, os.path.join(tmp, 'words.npy'))
+        perms = a1.permutations()
+        test_words = {a + b for a, b in perms.index} & {'AT', 'TA', 'AB'}
+        
+        # create assert method
+        self.assertEqual(set(matches.index), test_words)
+        self.assertEqual(matches.loc['AT', 'count'], perms.loc[('A','T'), 'count'])
+
+
+###############################
+# RUNNING ANALYZER CLASS TEST #
+###############################
+
+
+class RunningAnalyzerTestSuite(unittest.TestCase):
+    
+    def test_20_running_analyzer_play(self):
+        """
+        Test running aggregates over chunks match an Analyzer of the same rolls.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3]))
+        d2 = Die(np.array([1,2,3]))
+        g1 = Game([d1,d2], seed=3)
+        g2 = Game([d1,d2], seed=3)
+        
+        r1 = RunningAnalyzer(g1)
+        r1.play(100, chunk_size=30)
+        g2._game_results = np.concatenate(list(g2.iter_play(100, chunk_size=30)))
+        a1 = Analyzer(g2)
+        
+        # create test variables
+        perms = r1.permutations()['count'].sort_index()
+        test_perms = a1.permutations()['count'].sort_index()
+        combos = r1.combo_counts()['count'].sort_index()
+        test_combos = a1.combo_counts()['count'].sort_index()
+        
+        # create assert method
+        self.assertEqual(r1.rolls, 100)
+        self.assertEqual(r1.jackpot_counts(), a1.jackpot_counts())
+        self.assertEqual(r1.face_counts()['count'].sum(), 200)
+        self.assertEqual(perms.tolist(), test_perms.tolist())
+        self.assertEqual(combos.tolist(), test_combos.tolist())
+        r2 = RunningAnalyzer(Game([d1,d2], seed=3), stats=['jackpot_counts'])
+        r2.play(100, chunk_size=30)
+        self.assertEqual(r2.jackpot_counts(), r1.jackpot_counts())
+        self.assertEqual(len(r2._perms[0]), 0)
+        with self.assertRaises(ValueError):
+            r2.permutations()
+    
+    
+    def test_21_running_analyzer_stop(self):
+        """
+        Test play() stops after the chunk where stop returns True.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3]))
+        g1 = Game([d1])
+        r1 = RunningAnalyzer(g1)
+        
+        # create test variables
+        r1.play(1000, chunk_size=10, stop=lambda r: r.rolls >= 30)
+        
+        # create assert method
+        self.assertEqual(r1.rolls, 30)
+
+
+    def test_32_running_analyzer_play_until(self):
+        """
+        Test play_until() stops once the interval is narrower than the width.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2]))
+        d2 = Die(np.array([1,2]))
+        g1 = Game([d1,d2], seed=11)
+        r1 = RunningAnalyzer(g1)
+        
+        # create test variables
+        history = r1.play_until(0.1, chunk_size=50, max_rolls=10000)
+        last = history.iloc[-1]
+        
+        # create assert method
+        self.assertEqual(history.index[-1], r1.rolls)
+        self.assertLess(r1.rolls, 10000)
+        self.assertLessEqual(last['upper'] - last['lower'], 0.1)
+        self.assertGreater(history.iloc[0]['upper'] - history.iloc[0]['lower'], 0.1)
+        self.assertTrue(last['lower'] <= last['estimate'] <= last['upper'])
+        self.assertEqual(r1.stats, ['jackpot_counts'])
+        self.assertEqual(len(r1._perms[0]), 0)
+
+    def test_41_running_analyzer_merge_save(self):
+        """
+        Test merged shards match one analyzer of all chunks and survive save/load.
+        """
+        # create test objects
+        g1 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=8)
+        chunks = list(g1.iter_play(300, chunk_size=100))
+        shards = [RunningAnalyzer(g1) for _ in chunks]
+        r1 = RunningAnalyzer(g1)
+        for shard, codes in zip(shards, chunks):
+            shard.update(codes)
+            r1.update(codes)
+        
+        # create test variables
+        merged = shards[0].merge(shards[1]).merge(shards[2])
+        with tempfile.TemporaryDirectory() as store:
+            path = os.path.join(store, 'summary.npz')
+            merged.save(path)
+            loaded = RunningAnalyzer.load(path)
+        
+        # create assert method
+        self.assertEqual(loaded.rolls, 300)
+        self.assertEqual(loaded.jackpot_counts(), r1.jackpot_counts())
+        self.assertTrue(loaded.permutations().equals(r1.permutations()))
+        self.assertTrue(shards[0].merge(shards[1].merge(shards[2])).combo_counts().equals(r1.combo_counts()))
+        with self.assertRaises(ValueError):
+            merged.merge(RunningAnalyzer(Game([Die(np.array([1,2,3]))])))
+        mixed = RunningAnalyzer(Game([Die(np.array([1,2,3])), Die(np.array(['a','b'], dtype=object))]))
+        with tempfile.TemporaryDirectory() as store, self.assertRaises(ValueError):
+            mixed.save(os.path.join(store, 'mixed.npz'))
+
+
+##############################
+# SKETCH ANALYZER CLASS TEST #
+##############################
+
+
+class SketchAnalyzerTestSuite(unittest.TestCase):
+    
+    def test_42_sketch_analyzer_estimates(self):
+        """
+        Test sketch estimates bound the exact permutation counts.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2,3,4,5,6]))
+        d1.change_weights(6, 20)
+        g1 = Game([d1,d1,d1], seed=9)
+        s1 = SketchAnalyzer(g1, width=64, top_k=10)
+        r1 = RunningAnalyzer(Game([d1,d1,d1], seed=9))
+        
+        # create test variables
+        s1.play(5000, chunk_size=1000)
+        r1.play(5000, chunk_size=1000)
+        exact = r1.permutations()['count']
+        top = s1.permutations()
+        count, error = s1.permutation_count((6,6,6))
+        distinct, distinct_error = s1.distinct_permutations()
+        
+        # create assert method
+        self.assertEqual(top.index[0], (6,6,6))
+        self.assertTrue(all(exact[p] <= c <= exact[p] + e for p, c, e in zip(top.index, top['count'], top['error'])))
+        self.assertTrue(exact[(6,6,6)] <= count <= exact[(6,6,6)] + error)
+        self.assertLess(abs(distinct - len(exact)), 3 * distinct_error)
+        with self.assertRaises(ValueError):
+            SketchAnalyzer(Game([Die(np.arange(26)) for _ in range(14)]))
+
+
+#############################
+# EXACT ANALYZER CLASS TEST #
+#############################
+
+
+class ExactAnalyzerTestSuite(unittest.TestCase):
+    
+    def test_30_exact_analyzer_jackpot_counts(self):
+        """
+        Test exact jackpot counts match the product of face probabilities.
+        """
+        # create test objects
+        d1 = Die(np.array([1,2]))
+        d2 = Die(np.array([1,2]))
+        d2.change_weights(2, 3)
+        g1 = Game([d1,d2])
+        e1 = ExactAnalyzer(g1)
+        
+        # create test variables
+        counts = e1.jackpot_counts(rolls=100)
+        test_counts = 100 * (0.5 * 0.25 + 0.5 * 0.75)
+        
+        # create assert method
+        self.assertAlmostEqual(counts, test_counts)
+    
+    
+    def test_31_exact_analyzer_combo_perm_counts(self):
+        """
+        Test exact combos and permutations sum to one and agree with each other.
+        """
+        # create test objects
+        d1 = Die(np.array(['A','B','C']))
+        d2 = Die(np.array(['A','B','C']))
+        d3 = Die(np.array(['A','B','C']))
+        d1.change_weights('A', 4)
+        d2.change_weights('A', 4)
+        d3.change_weights('A', 4)
+        g1 = Game([d1,d2,d3])
+        e1 = ExactAnalyzer(g1)
+        
+        # create test variables
+        combos = e1.combo_counts()
+        perms = e1.permutations()
+        test_prob = perms.loc[[('A','A','B'), ('A','B','A'), ('B','A','A')], 'probability'].sum()
+        
+        # create assert method
+        self.assertEqual(len(combos), 10)
+        self.assertEqual(len(perms), 27)
+        self.assertAlmostEqual(combos['probability'].sum(), 1)
+        self.assertAlmostEqual(combos.loc[('A','A','B'), 'probability'], test_prob)
+        self.assertAlmostEqual(e1.face_count_distribution().loc['A', 3], (4/6) ** 3)
+        with self.assertRaises(ValueError):
+            e1.permutations(max_outcomes=10)
+
+
+#########################
+# EXPERIMENT CLASS TEST #
+#########################
+
+
+class ExperimentTestSuite(unittest.TestCase):
+    
+    def test_29_experiment_run(self):
+        """
+        Test run() collects statistics for every configuration in the grid.
+        """
+        # create test objects
+        e1 = Experiment(np.array([1,2,3]),
+                        {'dice': [2,3], 'weights': [None, {3: 0}], 'rolls': [50]},
+                        ['jackpot_counts', 'face_counts'])
+        
+        # create test variables
+        results = e1.run(seed=5, chunk_size=20)
+        test_results = e1.run(workers=2, seed=5, chunk_size=20)
+        faces = results[results['statistic'] == 'face_counts']
+        
+        # create assert method
+        self.assertEqual(results['experiment'].nunique(), 4)
+        self.assertTrue(results.equals(test_results))
+        self.assertEqual(faces.groupby('experiment')['value'].sum().tolist(), [100, 100, 150, 150])
+        self.assertEqual(faces[faces['outcome'] == 3]['value'].tolist()[1::2], [0, 0])
+        with self.assertRaises(ValueError):
+            Experiment(np.array([1,2,3]), {'dice': [2], 'rolls': [5]}, ['mean'])
+
+
+
+#######################
+# PROFILER CLASS TEST #
+#######################
+
+
+class ProfilerTestSuite(unittest.TestCase):
+    
+    def test_38_profiler_report(self):
+        """
+        Test profiler times phases and counts rolls and cache use only while active.
+        """
+        # create test objects
+        g1 = Game([Die(np.array([1,2,3])), Die(np.array([1,2,3]))], seed=1)
+        a1 = Analyzer(g1)
+        reports = []
+        
+        # create test variables
+        with Profiler(callback=reports.append) as p1:
+            g1.play_game(100)
+            a1.jackpot_counts()
+            a1.jackpot_counts()
+        g1.play_game(100)
+        report = reports[0]
+        
+        # create assert method
+        self.assertEqual(report['phases']['Game.play_game']['calls'], 1)
+        self.assertEqual(report['phases']['Analyzer.jackpot_counts']['calls'], 2)
+        self.assertEqual(report['counters']['die_rolls'], 200)
+        self.assertEqual((report['counters']['cache_hits'], report['counters']['cache_misses']), (1, 1))
+        self.assertIn({'metric': 'counters.game_rolls', 'value': 100}, p1.records())
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
     
\ No newline at end of file
@@ -1,7 +1,500 @@
 # IMPORT LIBRARIES
-import pandas as pd
 import numpy as np
-import random
+import functools
+import importlib
+import itertools
+import math
+import statistics
+import time
+import os
+
+
+class _LazyModule:
+    
+    """
+    A stand-in for a module that is only imported when one of its
+    attributes is first used, so importing this module stays fast when
+    pandas or process pools are never needed.
+    """
+    
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    
+    def __getattr__(self, attr):
+        # only called for attributes not set in __init__
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+pd = _LazyModule('pandas')
+futures = _LazyModule('concurrent.futures')
+asyncio = _LazyModule('asyncio')
+
+# active Profiler, None when profiling is off
+_PROFILER = None
+
+
+def _nbytes(value):
+    """
+    Get the memory held by a computed statistic or results.
+
+    Parameters
+    ----------
+    value : int, dataframe, numpy array or tuple
+        A statistic or results table.
+
+    Returns
+    -------
+    nbytes : int
+        Bytes of array or dataframe data, 0 for scalars.
+    """
+    
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    if hasattr(value, 'memory_usage'):
+        return int(value.memory_usage(index=True).sum())
+    
+    return getattr(value, 'nbytes', 0)
+
+
+def _profiled(phase):
+    """
+    Decorate a function to time each call under a phase name while a
+    Profiler is active. When profiling is off the only cost is one check.
+
+    Parameters
+    ----------
+    phase : str
+        Name of the phase in the profiler report, e.g. 'Game.play_game'.
+
+    Returns
+    -------
+    decorate : function
+        Decorator wrapping the timed function.
+    """
+    
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _PROFILER
+            if profiler is None:
+                return func(*args, **kwargs)
+            
+            # time the call even if it raises
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.add_time(phase, time.perf_counter() - start)
+        
+        return wrapper
+    
+    return decorate
+
+
+def _code_dtype(n_faces):
+    """
+    Get the smallest integer dtype able to index a given number of faces.
+
+    Parameters
+    ----------
+    n_faces : int
+        Number of distinct faces to be indexed.
+
+    Returns
+    -------
+    dtype : numpy dtype
+        Signed integer dtype such as int8 or int16.
+    """
+    
+    return np.min_scalar_type(-n_faces)
+
+
+@_profiled('Game.sample')
+def _roll_dice(dice, rolls, rng, dtype, face_maps=None):
+    """
+    Roll each die in a list of Die objects a given number of times.
+    Defined at module level so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    dice : list
+        A list of Die objects to be rolled.
+    rolls : int
+        Number of times the dice should be rolled.
+    rng : numpy Generator or SeedSequence
+        Random number generator, or seed for a new one, to draw from.
+    dtype : numpy dtype
+        Integer dtype for the returned face indices.
+    face_maps : list, optional
+        For each die, an array mapping its face indices to shared face
+        indices, or None if they are the same. The default is None.
+
+    Returns
+    -------
+    codes : numpy array
+        Matrix (rolls by dice) of indices into the shared faces.
+    """
+    
+    # workers receive a seed sequence or bit generator and create their own generator
+    if isinstance(rng, (np.random.SeedSequence, np.random.BitGenerator)):
+        rng = np.random.default_rng(rng)
+    if face_maps is None:
+        face_maps = [None] * len(dice)
+    
+    # roll each die for every round at once and store shared index of face rolled
+    codes = np.empty((rolls, len(dice)), dtype=dtype)
+    for j, d in enumerate(dice):
+        indices = d._sample_indices(rolls, rng)
+        codes[:, j] = indices if face_maps[j] is None else face_maps[j][indices]
+    
+    return codes
+
+
+def _row_keys(codes, n_faces):
+    """
+    Pack each row of face indices into a single base n_faces integer key.
+    If every possible row does not fit in 64 bits, rows are kept as is.
+
+    Parameters
+    ----------
+    codes : numpy array
+        Matrix (rolls by dice) of face indices.
+    n_faces : int
+        Number of distinct faces the indices refer to.
+
+    Returns
+    -------
+    keys : numpy array
+        One uint64 key per row, or the rows themselves if they cannot be packed.
+    """
+    
+    # keep rows unpacked when all outcomes do not fit in an unsigned 64 bit key
+    if n_faces ** codes.shape[1] > 2 ** 64:
+        return codes
+    
+    # first die is the most significant digit so keys sort like rows
+    keys = np.zeros(codes.shape[0], dtype=np.uint64)
+    for j in range(codes.shape[1]):
+        keys = keys * np.uint64(n_faces) + codes[:, j].astype(np.uint64)
+    
+    return keys
+
+
+def _key_rows(keys, n_faces, n_dice):
+    """
+    Unpack keys made by _row_keys back into rows of face indices.
+
+    Parameters
+    ----------
+    keys : numpy array
+        Keys from _row_keys.
+    n_faces : int
+        Number of distinct faces the indices refer to.
+    n_dice : int
+        Number of dice (digits) in each key.
+
+    Returns
+    -------
+    codes : numpy array
+        Matrix (keys by dice) of face indices.
+    """
+    
+    # unpacked rows are returned as is
+    if keys.ndim == 2:
+        return keys
+    
+    # peel digits off the least significant (last) die first
+    keys = keys.copy()
+    codes = np.empty((keys.shape[0], n_dice), dtype=np.intp)
+    for j in range(n_dice-1, -1, -1):
+        codes[:, j] = keys % np.uint64(n_faces)
+        keys //= np.uint64(n_faces)
+    
+    return codes
+
+
+def _splitmix64(keys):
+    """
+    Scramble 64 bit keys with the splitmix64 finalizer so that nearby keys
+    get unrelated hashes.
+
+    Parameters
+    ----------
+    keys : numpy array
+        Unsigned 64 bit keys.
+
+    Returns
+    -------
+    hashes : numpy array
+        Unsigned 64 bit hash of each key.
+    """
+    
+    # unsigned array arithmetic wraps around modulo 2**64
+    z = keys + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    
+    return z ^ (z >> np.uint64(31))
+
+
+def _merge_counts(keys, counts, new_keys, new_counts):
+    """
+    Combine two tables of distinct keys and their counts.
+
+    Parameters
+    ----------
+    keys, new_keys : numpy array
+        Sorted distinct keys from _row_keys in each table.
+    counts, new_counts : numpy array
+        Number of times each key occurred in each table.
+
+    Returns
+    -------
+    keys : numpy array
+        Sorted distinct keys in either table.
+    counts : numpy array
+        Total count of each key.
+    """
+    
+    # packed keys are sorted, so add matching counts and insert new keys in place
+    if keys.ndim == 1:
+        pos = np.searchsorted(keys, new_keys)
+        found = pos < len(keys)
+        found[found] = keys[pos[found]] == new_keys[found]
+        counts = counts.copy()
+        counts[pos[found]] += new_counts[found]
+        keys = np.insert(keys, pos[~found], new_keys[~found])
+        counts = np.insert(counts, pos[~found], new_counts[~found])
+        
+        return keys, counts
+    
+    # stack both tables of unpacked rows and add up counts of matching rows
+    all_keys = np.concatenate([keys, new_keys])
+    all_counts = np.concatenate([counts, new_counts])
+    keys, inverse = np.unique(all_keys, axis=0, return_inverse=True)
+    counts = np.zeros(keys.shape[0], dtype=np.int64)
+    np.add.at(counts, inverse.ravel(), all_counts)
+    
+    return keys, counts
+
+
+def _counts_frame(keys, counts, faces, n_dice):
+    """
+    Create a dataframe of distinct rolls and their counts from keys.
+
+    Parameters
+    ----------
+    keys : numpy array
+        Distinct keys from _row_keys.
+    counts : numpy array
+        Number of times each key occurred.
+    faces : numpy array
+        Faces the keys index into.
+    n_dice : int
+        Number of dice in each roll.
+
+    Returns
+    -------
+    frame : dataframe
+        A dataframe with a MultiIndex of distinct rolls and a count column,
+        sorted from most to least frequent.
+    """
+    
+    # order from most to least frequent, ties stay in key order
+    order = np.argsort(-counts, kind='stable')
+    codes = _key_rows(keys[order], len(faces), n_dice)
+    
+    # decode only distinct rows to faces for the index
+    idx = pd.MultiIndex.from_arrays([faces[codes[:, j]] for j in range(n_dice)],
+                                    names = list(range(n_dice)))
+    frame = pd.DataFrame({'count': counts[order].astype(np.int64)}, index=idx)
+    
+    return frame
+
+
+# sorted word arrays already loaded, keyed by path and modified time
+_VOCABULARIES = {}
+
+
+def _load_vocabulary(vocab_path, index_path=None):
+    """
+    Load a word list (one word per line) as a sorted array of distinct
+    words. Each file is only read once per process, and the sorted array
+    can be saved to an index file that later processes memory map instead
+    of reading and sorting the word list again.
+
+    Parameters
+    ----------
+    vocab_path : str
+        Path to word list such as scrabble_words.txt.
+    index_path : str, optional
+        Path to a .npy index of the sorted words. Created if missing or
+        older than the word list. The default is None (no index file).
+
+    Returns
+    -------
+    vocab : numpy array
+        Sorted distinct words.
+    """
+    
+    # reuse words loaded from the same unchanged file
+    key = (os.path.abspath(vocab_path), os.path.getmtime(vocab_path))
+    if key in _VOCABULARIES:
+        return _VOCABULARIES[key]
+    
+    # memory map an index that is newer than the word list
+    if index_path is not None and os.path.exists(index_path) \
+            and os.path.getmtime(index_path) >= key[1]:
+        vocab = np.load(index_path, mmap_mode='r')
+    
+    # otherwise read, sort and optionally save words
+    else:
+        with open(vocab_path) as f:
+            vocab = np.unique(np.array(f.read().split()))
+        if index_path is not None:
+            np.save(index_path, vocab)
+    
+    _VOCABULARIES[key] = vocab
+    
+    return vocab
+
+
+def _copy_result(value):
+    """
+    Copy a computed statistic so callers cannot change a cached value.
+
+    Parameters
+    ----------
+    value : int, dataframe, numpy array or tuple
+        A statistic returned by an Analyzer method.
+
+    Returns
+    -------
+    value : int, dataframe, numpy array or tuple
+        Copy of the statistic.
+    """
+    
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if hasattr(value, 'copy'):
+        return value.copy()
+    
+    return value
+
+
+def _memoized(method):
+    """
+    Decorate an Analyzer method to reuse its result until the game is
+    played again or a die weight changes. The decorated method takes an
+    extra copy keyword, True by default; with copy=False the cached result
+    itself is returned and should be treated as read-only.
+
+    Parameters
+    ----------
+    method : function
+        Analyzer method computing a statistic from game results.
+
+    Returns
+    -------
+    wrapper : function
+        Method returning a copy of the cached statistic when available.
+    """
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, copy=True, **kwargs):
+        # clear every cached statistic once the game state has moved on
+        state = self.game._cache_state()
+        if state != self._cache_state:
+            self._cache = {}
+            self._cache_state = state
+        
+        # compute statistic once per set of arguments
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        hit = key in self._cache
+        if not hit:
+            self._cache[key] = method(self, *args, **kwargs)
+        result = self._cache[key]
+        if copy:
+            result = _copy_result(result)
+        
+        if _PROFILER is not None:
+            _PROFILER.add('cache_hits' if hit else 'cache_misses')
+            if copy:
+                _PROFILER.add('copies')
+                _PROFILER.add('copied_bytes', _nbytes(result))
+        
+        return result
+    
+    return wrapper
+
+
+def _run_experiment(faces, config, stats, chunk_size, seed):
+    """
+    Play one experiment configuration and collect requested statistics.
+    Defined at module level so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    faces : numpy array
+        Faces of every die.
+    config : dict
+        Values of 'dice', 'weights' and 'rolls' for this experiment.
+    stats : list
+        Names of statistics to collect.
+    chunk_size : int
+        Number of rolls per chunk.
+    seed : numpy SeedSequence
+        Seed of this experiment.
+
+    Returns
+    -------
+    records : list
+        One dict per statistic outcome with keys statistic, outcome, value.
+    """
+    
+    # build identical dice with the configured weights
+    dice = []
+    for _ in range(config['dice']):
+        die = Die(faces.copy())
+        if config['weights'] is not None:
+            die.update_weights(config['weights'])
+        dice.append(die)
+    
+    # play in chunks keeping only the running aggregates the statistics need
+    needed = ['jackpot_counts' if stat == 'jackpot_ratio' else stat for stat in stats]
+    analyzer = RunningAnalyzer(Game(dice, seed), needed)
+    analyzer.play(config['rolls'], chunk_size)
+    
+    # flatten each statistic into outcome and value records
+    records = []
+    for stat in stats:
+        if stat == 'jackpot_counts':
+            records.append({'statistic': stat, 'outcome': None, 'value': analyzer.jackpot_counts()})
+        elif stat == 'jackpot_ratio':
+            records.append({'statistic': stat, 'outcome': None,
+                            'value': analyzer.jackpot_counts() / analyzer.rolls})
+        elif stat == 'face_counts':
+            records += [{'statistic': stat, 'outcome': face, 'value': value}
+                        for face, value in zip(faces.tolist(), analyzer._face_totals.tolist())]
+        else:
+            # decode distinct keys to tuples of faces without building dataframes
+            if stat == 'combo_counts':
+                keys, counts = analyzer._combos
+                key_faces = faces[analyzer.game._face_order()]
+            else:
+                keys, counts = analyzer._perms
+                key_faces = faces
+            rows = key_faces[_key_rows(keys, len(faces), config['dice'])].tolist()
+            records += [{'statistic': stat, 'outcome': tuple(row), 'value': value}
+                        for row, value in zip(rows, counts.tolist())]
+    
+    return records
+
 
 #############
 # DIE CLASS #
@@ -22,9 +515,14 @@ class Die:
         Values may be strings or numbers and must be distinct.
     weights : int or floats
         Positive numbers (integers or floats, including 0)
-    _settings : DataFrame
-        Private attribute for storing die faces and weights. Not to be
-        manipulated directly, but documented for clarity.
+    _alias : tuple
+        Private attribute caching the alias table (probabilities and aliases)
+        used for sampling. Built on first roll and cleared when weights change.
+    _seed : int, numpy SeedSequence or Generator
+        Private attribute for the seed of the random number generator.
+    _rng : numpy Generator
+        Private attribute for the random number generator used to roll die,
+        created from _seed on first roll.
 
     Methods
     -------
@@ -32,6 +530,10 @@ class Die:
         Creates initial class object with faces and default weights.
     change_weights():
         Changes weight associated with specified face of class object.
+    update_weights():
+        Changes weights of many or all faces of class object at once.
+    from_frequencies():
+        Creates class object from a file of faces and weights.
     roll_die():
         Returns results from N rolls of class object.
     show_state():
@@ -40,8 +542,10 @@ class Die:
         Returns string representation of class object.
     """
 
+    __slots__ = ('faces', 'weights', '_alias', '_seed', '_rng')
+
 
-    def __init__(self, faces):
+    def __init__(self, faces, seed=None):
         """
         Initialize an equal weighted Die object with given distinct faces.
 
@@ -49,6 +553,9 @@ class Die:
         ----------
         faces : numpy array
             Values may be strings or numbers and must be distinct.
+        seed : int, numpy SeedSequence or Generator, optional
+            Seed for the random number generator used by roll_die(), or a
+            generator to share. The default is None (unpredictable seed).
 
         Returns
         -------
@@ -75,10 +582,10 @@ class Die:
         self.faces = faces
         self.weights = np.ones(len(self.faces))
         
-        # store die object settings to private dataframe with faces as index
-        self._settings = pd.DataFrame(data = {'weights': self.weights},
-                                      index = self.faces)
-        self._settings.index.name = 'faces'
+        # sampling table and generator are built lazily on first roll
+        self._alias = None
+        self._seed = seed
+        self._rng = None
         
         return
 
@@ -118,14 +625,116 @@ class Die:
             except:
                 raise TypeError('Not a valid weight. Weight should be of type int or float or castable as numeric.')
         
-        # if no errors, update weights and settings attributes with new weight
+        # if no errors, update weights attribute with new weight
         new_weight = float(weight)
         self.weights[self.faces == face] = new_weight
-        self._settings.loc[face] = new_weight
+        
+        # clear cached sampling table so next roll uses new weights
+        self._alias = None
+        
+        return
+
+
+    def update_weights(self, weights):
+        """
+        Change the weights of many faces of a Die object at once. All
+        weights are checked before any are changed.
+
+        Parameters
+        ----------
+        weights : dict or array-like
+            Either a mapping of face values to new weights, or a sequence
+            with a new weight for every face in Die.faces order.
+        
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        IndexError
+            If a face in the mapping is not in the Die object's faces.
+        TypeError
+            If a weight is not numeric or castable as numeric.
+        ValueError
+            If weights are not a sequence the same length as the faces, or
+            a weight is negative or not finite.
+        """
+        
+        # find position of each face in the mapping, or use all faces in order
+        if isinstance(weights, dict):
+            positions = {face: i for i, face in enumerate(self.faces.tolist())}
+            try:
+                idx = np.array([positions[face] for face in weights], dtype=np.intp)
+            except KeyError:
+                raise IndexError('Face not found in Die faces. Try again with different face or use Die.faces to view valid options.')
+            values = list(weights.values())
+        else:
+            idx = np.arange(len(self.faces))
+            values = weights
+            if np.ndim(values) != 1 or len(values) != len(self.faces):
+                raise ValueError('Number of weights must match number of Die faces.')
+        
+        # cast and check all weights at once, raise before any are changed
+        try:
+            values = np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            raise TypeError('Not a valid weight. Weight should be of type int or float or castable as numeric.')
+        if not (np.isfinite(values).all() and (values >= 0).all()):
+            raise ValueError('Die weights must be finite and not negative.')
+        
+        # if no errors, update weights attribute with new weights
+        self.weights[idx] = values
+        
+        # clear cached sampling table so next roll uses new weights
+        self._alias = None
         
         return
 
 
+    @classmethod
+    def from_frequencies(cls, path, seed=None):
+        """
+        Create a Die object from a text file with one face and its weight
+        per line separated by whitespace, such as english_letters.txt.
+        Faces are read as strings.
+
+        Parameters
+        ----------
+        path : str
+            Path to file of faces and weights.
+        seed : int, numpy SeedSequence or Generator, optional
+            Seed for the random number generator. The default is None.
+
+        Returns
+        -------
+        die : Die object
+            Die with the faces and weights in the file.
+        
+        Raises
+        ------
+        ValueError
+            If a line does not have exactly one face and one weight, or
+            faces are not distinct.
+        TypeError
+            If a weight is not numeric.
+        """
+        
+        # read faces and weights as two columns
+        with open(path) as f:
+            rows = [line.split() for line in f if line.strip()]
+        if any(len(row) != 2 for row in rows):
+            raise ValueError('Each line must have one face and one weight.')
+        faces, weights = zip(*rows)
+        
+        # create die and set all weights in one step
+        die = cls(np.array(faces), seed)
+        die.update_weights(weights)
+        
+        return die
+
+
+    @_profiled('Die.roll_die')
     def roll_die(self, num_rolls=1):
         """
         Roll a Die object a given number of times. A random sample with
@@ -148,14 +757,100 @@ class Die:
             num_rolls = 1
         
         # roll die and store as results
-        results = random.choices(population = self._settings.index,
-                                 weights = self._settings['weights'],
-                                 k = num_rolls)
+        if self._rng is None:
+            self._rng = np.random.default_rng(self._seed)
+        indices = self._sample_indices(num_rolls, self._rng)
+        results = self.faces[indices].tolist()
+        
+        if _PROFILER is not None:
+            _PROFILER.add('die_rolls', num_rolls)
         
         # return results from roll
         return results
 
 
+    def _sample_indices(self, num_rolls, rng):
+        """
+        Draws face indices of a Die object using the cached alias table
+        so each draw costs constant time regardless of the number of faces.
+
+        Parameters
+        ----------
+        num_rolls : int
+            Number of times Die object is rolled.
+        rng : numpy Generator
+            Random number generator to draw from.
+
+        Returns
+        -------
+        indices : numpy array
+            Index into die faces of each face rolled.
+        """
+        
+        # build alias table once per set of weights
+        if self._alias is None:
+            self._alias = self._build_alias()
+        prob, alias = self._alias
+        
+        # pick a column uniformly then keep it or take its alias
+        columns = rng.integers(len(prob), size=num_rolls)
+        keep = rng.random(num_rolls) < prob[columns]
+        indices = np.where(keep, columns, alias[columns])
+        
+        return indices
+
+
+    def _build_alias(self):
+        """
+        Builds the Walker/Vose alias table for the current weights.
+
+        Returns
+        -------
+        prob : numpy array
+            Probability of keeping each column instead of its alias.
+        alias : numpy array
+            Face index used when a column is not kept.
+        
+        Raises
+        ------
+        ValueError
+            If a weight is negative or not finite, or Die object has no
+            positive weights to sample from.
+        """
+        
+        # scale weights so the average column holds probability one
+        weights = np.asarray(self.weights, dtype=float)
+        if not (np.isfinite(weights).all() and (weights >= 0).all()):
+            raise ValueError('Die weights must be finite and not negative.')
+        total = weights.sum()
+        if not total > 0:
+            raise ValueError('Total of Die weights must be greater than zero.')
+        scaled = weights * len(weights) / total
+        
+        prob = np.ones(len(weights))
+        alias = np.arange(len(weights))
+        
+        # zero weight faces go last so they are paired first and never left over
+        small = list(np.flatnonzero((scaled < 1) & (scaled > 0)))
+        small += list(np.flatnonzero(scaled == 0))
+        large = list(np.flatnonzero(scaled >= 1))
+        
+        # fill each under-full column with mass from an over-full column
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1
+            if scaled[l] < 1:
+                small.append(l)
+            else:
+                large.append(l)
+        
+        # any columns left are full up to rounding error
+        return prob, alias
+
+
     def show_state(self):
         """
         Displays all the faces and weights associated with Die object.
@@ -166,8 +861,9 @@ class Die:
             A dataframe with faces and associated weights.
         """
 
-        # return copy of private dataframe with faces and weights of die
-        states = self._settings.copy(deep=True)
+        # return new dataframe with copies of faces and weights of die
+        states = pd.DataFrame(data = {'weights': self.weights.copy()},
+                              index = pd.Index(self.faces.copy(), name='faces'))
         
         return states
 
@@ -193,18 +889,49 @@ class Game:
     
     """
     A class used to simulate rolls with a Die class and consists of rolling
-    one or more Die objects one or more times. A Game class must consist of
-    Die class objects with the same number of sides and associated faces but
-    may have varying weights among Die. A Game class plays a game with Die
-    objects and stores results of recent game play.
+    one or more Die objects one or more times. Die objects in a Game may
+    have different faces (e.g. a six sided die with a twenty sided die) and
+    varying weights; faces of all dice are mapped onto one shared set of
+    faces. A Game class plays a game with Die objects and stores results of
+    recent game play.
 
     Attributes
     ----------
     dice : list
-        A list of Die objects consisting of one or more similar Die objects.
-    _game_results : DataFrame
-        Private attribute for storing recent game play results. Not to be
+        A list of one or more Die objects.
+    _game_results : numpy array
+        Private attribute for storing recent game play results as a compact
+        integer matrix (rolls by dice) of indices into _faces. Not to be
         manipulated directly, but documented for clarity.
+    _faces : numpy array
+        Private attribute for the faces of all dice in order of first
+        appearance, used to decode game results.
+    _face_maps : list
+        Private attribute mapping each die's face indices to indices into
+        _faces, None for dice whose faces are the same as _faces.
+    _seed_seq : numpy SeedSequence
+        Private attribute for the seed of the game, spawns independent
+        streams for parallel game play.
+    _rng : numpy Generator
+        Private attribute for the random number generator used to roll dice.
+    _key : numpy array
+        Private attribute for the Philox key of counter-based streams, None
+        if the game is not counter based.
+    _plays : int
+        Private attribute counting counter-based plays, each play uses its
+        own range of Philox counters.
+    _last_stream : tuple
+        Private attribute for the play number, chunk size and rolls of the
+        most recent counter-based play, used to replay its rolls.
+    _generation : int
+        Private attribute counting games played, used to tell when results
+        computed from earlier game play are out of date.
+    _narrow : tuple
+        Private attribute caching the narrow form of results along with the
+        game play generation it was built from.
+    _likelihood : numpy array
+        Private attribute for the likelihood ratio of each roll from
+        importance sampling, None for other sampling modes.
 
     Methods
     -------
@@ -212,14 +939,25 @@ class Game:
         Creates initial class object with list of Die objects.
     play_game():
         Rolls Die objects a given number of times and saves results.
+    iter_play():
+        Yields results of rolling Die objects in chunks without saving them.
+    aplay():
+        Yields chunks of results to async code without blocking the event loop.
+    replay():
+        Returns a range of rolls from the last counter-based play again.
+    from_store():
+        Reopens a game from results saved to disk.
     show_results():
         Returns results from game play round.
     __str__():
         Returns string representation of class object.
     """
+
+    __slots__ = ('dice', '_faces', '_face_maps', '_game_results', '_seed_seq', '_rng', '_key',
+                 '_plays', '_last_stream', '_generation', '_narrow', '_likelihood')
     
     
-    def __init__(self, dice):
+    def __init__(self, dice, seed=None, counter_based=False):
         """
         Initialize a Game object to perform game actions on one
         or more given Die objects.
@@ -227,9 +965,16 @@ class Game:
         Parameters
         ----------
         dice : list
-            A list of valid Die objects. Each Die object in a Game
-            has the same number of sides and associated faces,
-            but may have different weights.
+            A list of valid Die objects. Die objects may have different
+            faces and weights.
+        seed : int, numpy SeedSequence or Generator, optional
+            Seed for the random number generator used to play the game, or
+            a generator to play from. The default is None (unpredictable
+            seed).
+        counter_based : bool, optional
+            If True, rolls are played in chunks from Philox counter-based
+            streams so any chunk can be regenerated on its own with
+            replay(). The default is False.
 
         Returns
         -------
@@ -240,127 +985,2405 @@ class Game:
         TypeError
             If die are not a list of Die objects
         ValueError
-            If die do not all have the same face number and values.
+            If die list is empty.
         """
 
         # make sure game object is initialized with list of dice objects
         if not isinstance(dice, list):
             raise TypeError('Dice parameter must be of list type.')
+        if len(dice) == 0:
+            raise ValueError('Dice list must contain at least one Die object.')
         
-        # if dice is of list type, loop through list and check for dice objects and equality
+        # if dice is of list type, loop through list and check for dice objects
         for die in dice:
-            # check for dice objects and raise error if needed
             if str(die) != 'Die':
                 raise TypeError('Dice list does not contain all dice objects. Double check dice objects and try creating Game again.')
-                
-            # check each die's faces are equal to first die
-            if not np.array_equal(dice[0].faces, die.faces):
-                raise ValueError('Die objects do not have all the same face length and values. Make sure all die objects are the same for each Game.')
 
-        # if no errors, assign list of die objects to game and create empty dataframe for results
+        # if no errors, assign list of die objects to game and create empty face index matrix for results
         self.dice = dice
-        self._game_results = pd.DataFrame()
+        self._faces, self._face_maps = self._shared_faces(dice)
+        self._game_results = np.empty((0, len(dice)), dtype=_code_dtype(len(self._faces)))
+        
+        # keep the seed sequence behind the generator to spawn streams from
+        if isinstance(seed, np.random.Generator):
+            self._seed_seq = seed.bit_generator.seed_seq
+            self._rng = seed
+        else:
+            if isinstance(seed, np.random.SeedSequence):
+                self._seed_seq = seed
+            else:
+                self._seed_seq = np.random.SeedSequence(seed)
+            self._rng = np.random.default_rng(self._seed_seq)
+        
+        # counter-based games derive a fixed Philox key from the seed
+        self._key = self._seed_seq.generate_state(2, np.uint64) if counter_based else None
+        self._plays = 0
+        self._last_stream = None
+        self._generation = 0
+        self._narrow = None
+        self._likelihood = None
         
         return
 
 
-    def play_game(self, rolls):
+    @staticmethod
+    def _shared_faces(dice):
         """
-        Rolls Die objects a given number of times and compile results.
+        Combine faces of all dice and map each die's faces onto them.
 
         Parameters
         ----------
-        rolls : int
-            Number of times the dice should be rolled.
+        dice : list
+            A list of Die objects.
 
         Returns
         -------
-        None.
+        faces : numpy array
+            Distinct faces of all dice in order of first appearance, an
+            object array if dice have faces of different kinds (e.g.
+            numbers and strings) so no face is converted. Faces equal in
+            value (e.g. 1 and 1.0, but not 1 and '1') are one face.
+        face_maps : list
+            For each die, an array of indices into faces for each of its
+            faces, or None if the die's faces are the same as faces.
         """
         
-        # make sure rolls entered is not less than 1
-        if rolls < 1:
-            print('Roll number cannot be less than 1. Setting to default 1 and playing game.')
-            rolls = 1
-
-        # if game already played, reset results dataframe to empty
-        if not self._game_results.empty:
-            self._game_results = pd.DataFrame()
+        face_maps = []
+        if len({d.faces.dtype.kind for d in dice}) > 1:
+            # different kinds of faces, keep each face as is and look up by value
+            positions = {}
+            for d in dice:
+                for face in d.faces.tolist():
+                    positions.setdefault(face, len(positions))
+            faces = np.empty(len(positions), dtype=object)
+            faces[:] = list(positions)
+            die_maps = [np.array([positions[face] for face in d.faces.tolist()], dtype=np.intp)
+                        for d in dice]
+        else:
+            # keep first occurrence of each face across all dice
+            all_faces = np.concatenate([d.faces for d in dice])
+            first = np.unique(all_faces, return_index=True)[1]
+            faces = all_faces[np.sort(first)]
             
+            # look up every die's faces in shared faces at once
+            order = np.argsort(faces)
+            die_maps = [order[np.searchsorted(faces, d.faces, sorter=order)] for d in dice]
         
-        # create row/col names for game results based on dice faces and roll num    
-        result_cols = [i for i in range(1,len(self.dice)+1)]
-        idx = [i for i in range(1,rolls+1)]
-        self._game_results = pd.DataFrame(columns=result_cols, index=idx)
-        self._game_results.index.name = 'roll'
+        for face_map in die_maps:
+            same = len(face_map) == len(faces) and (face_map == np.arange(len(faces))).all()
+            face_maps.append(None if same else face_map)
         
-        # for each roll, roll each die, save results to dataframe in wide format
-        for i in range(1, rolls+1):
-            
-            round_result = {}
+        return faces, face_maps
+
+
+    @_profiled('Game.play_game')
+    def play_game(self, rolls, workers=None, chunk_size=1_000_000, store=None,
+                  sampling='plain', proposal=None):
+        """
+        Rolls Die objects a given number of times and compile results.
+        All rolls of a die are drawn in one batch from the alias table
+        of that die.
+        
+        If workers is given, rolls are split into chunks of chunk_size and
+        played across a pool of processes. Each chunk draws from its own
+        stream spawned from the game seed, so results for a given seed and
+        chunk_size are the same for any number of workers.
+        
+        Counter-based games (counter_based=True) always play in chunks of
+        chunk_size, so a game gives the same results with or without workers
+        or store, and replay() can regenerate any range of its rolls.
+        
+        If store is given, results are written chunk by chunk to a
+        directory on disk and read back as a memory map, so games larger
+        than memory can be played. Use Game.from_store() to reopen them.
+        
+        Sampling modes other than 'plain' reduce the variance of estimates
+        from the same number of rolls. 'antithetic' pairs each roll with a
+        mirrored roll, 'stratified' spreads the rolls of each die evenly
+        over its distribution, and 'importance' rolls from proposal weights
+        and records the likelihood ratio of each roll so that weighted
+        statistics (e.g. Analyzer.jackpot_counts(weighted=True)) remain
+        unbiased for the real weights. Rare jackpots can be made common
+        by tilting the proposal towards one face.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        workers : int, optional
+            Number of worker processes. The default is None (play in
+            this process with a single stream).
+        chunk_size : int, optional
+            Number of rolls per chunk when workers or store is given. The
+            default is 1,000,000.
+        store : str, optional
+            Directory to write results to. The default is None (keep
+            results in memory).
+        sampling : str, optional
+            One of 'plain', 'antithetic', 'stratified' or 'importance'. The
+            default is 'plain'.
+        proposal : numpy array or list, optional
+            Weights to roll from for importance sampling, either one array
+            for all dice or one array per die, in face order. The default
+            is None.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If a Die object has no positive weights to sample from, the
+            sampling mode is not valid or is combined with workers or store,
+            or the proposal cannot roll a face the dice can roll or has
+            negative, non-finite or all zero weights.
+        """
+        
+        # make sure rolls entered is not less than 1
+        if rolls < 1:
+            print('Roll number cannot be less than 1. Setting to default 1 and playing game.')
+            rolls = 1
+
+        dtype = _code_dtype(len(self._faces))
+        
+        # check sampling mode, only plain sampling is chunked or parallel
+        if sampling not in ('plain', 'antithetic', 'stratified', 'importance'):
+            raise ValueError('Invalid option. Sampling must be "plain", "antithetic", "stratified" or "importance".')
+        if sampling != 'plain' and (workers is not None or store is not None):
+            raise ValueError('Sampling modes other than "plain" cannot be used with workers or store.')
+        
+        # roll each die for every round at once and store index of face rolled
+        likelihood = None
+        if sampling != 'plain':
+            # sampled rolls do not come from counter-based streams and cannot be replayed
+            codes, likelihood = self._play_sampled(rolls, sampling, proposal, dtype)
+            self._last_stream = None
+        elif store is not None:
+            if workers is None:
+                chunks = self.iter_play(rolls, chunk_size)
+            else:
+                chunks = self._iter_parallel(rolls, workers, chunk_size, dtype)
+            codes = self._write_store(store, rolls, chunks, dtype)
+        elif workers is None and self._key is not None:
+            codes = np.concatenate(list(self.iter_play(rolls, chunk_size)))
+        elif workers is None:
+            codes = _roll_dice(self.dice, rolls, self._rng, dtype, self._face_maps)
+        else:
+            codes = np.concatenate(list(self._iter_parallel(rolls, workers, chunk_size, dtype)))
+        
+        # save face indices, faces are only looked up when results are shown
+        self._game_results = codes
+        self._likelihood = likelihood
+        self._generation += 1
+        
+        if _PROFILER is not None:
+            _PROFILER.add('game_rolls', rolls)
+            _PROFILER.add('die_rolls', rolls * len(self.dice))
+            _PROFILER.add('allocated_bytes', codes.nbytes)
+
+        return
+
+
+    @_profiled('Game.sample')
+    def _play_sampled(self, rolls, sampling, proposal, dtype):
+        """
+        Rolls Die objects by inverting the cumulative probabilities of each
+        die at uniform draws arranged for the given sampling mode.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        sampling : str
+            One of 'antithetic', 'stratified' or 'importance'.
+        proposal : numpy array or list
+            Weights to roll from for importance sampling.
+        dtype : numpy dtype
+            Integer dtype for the face indices.
+
+        Returns
+        -------
+        codes : numpy array
+            Matrix (rolls by dice) of indices into _faces.
+        likelihood : numpy array
+            Likelihood ratio of each roll for importance sampling, else None.
+        """
+        
+        probs = self._probabilities()
+        
+        # roll from proposal weights for importance sampling, else from the dice
+        sample_probs = probs
+        if sampling == 'importance':
+            if proposal is None:
+                raise ValueError('Importance sampling needs proposal weights.')
+            sample_probs = np.broadcast_to(np.asarray(proposal, dtype=float), probs.shape)
+            totals = sample_probs.sum(axis=1, keepdims=True)
+            if not (np.isfinite(sample_probs).all() and (sample_probs >= 0).all() and (totals > 0).all()):
+                raise ValueError('Proposal weights must be finite, not negative and not all zero.')
+            sample_probs = sample_probs / totals
+            if ((sample_probs <= 0) & (probs > 0)).any():
+                raise ValueError('Proposal weights must be positive for every face the dice can roll.')
+        
+        codes = np.empty((rolls, len(self.dice)), dtype=dtype)
+        log_ratio = np.zeros(rolls)
+        for j in range(len(self.dice)):
+            # arrange uniform draws for the sampling mode
+            if sampling == 'antithetic':
+                half = self._rng.random((rolls + 1) // 2)
+                draws = np.concatenate([half, 1 - half])[:rolls]
+            elif sampling == 'stratified':
+                draws = (self._rng.permutation(rolls) + self._rng.random(rolls)) / rolls
+            else:
+                draws = self._rng.random(rolls)
+            draws = np.minimum(draws, np.nextafter(1.0, 0.0))
+            
+            # invert cumulative probabilities, zero probability faces are never selected
+            cum_probs = np.cumsum(sample_probs[j])
+            cum_probs /= cum_probs[-1]
+            idx = np.searchsorted(cum_probs, draws, side='right')
+            codes[:, j] = idx
+            
+            # faces the die cannot roll (e.g. missing from a mixed die) get zero likelihood
+            ratio = probs[j, idx] / sample_probs[j, idx]
+            log_ratio += np.log(ratio, out=np.full(rolls, -np.inf), where=ratio > 0)
+        
+        # likelihood ratio only differs from one for importance sampling
+        likelihood = np.exp(log_ratio) if sampling == 'importance' else None
+        
+        return codes, likelihood
+
+
+    def iter_play(self, rolls, chunk_size=1_000_000):
+        """
+        Rolls Die objects a given number of times in chunks and yields the
+        face indices of each chunk. Results are not saved to the game, so
+        memory stays bounded by chunk_size however many rolls are played.
+        Stop iterating at any time to end the game early. Chunks of
+        counter-based games are each rolled from their own Philox stream.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 1,000,000.
+
+        Yields
+        ------
+        codes : numpy array
+            Matrix (chunk rolls by dice) of indices into the dice faces.
+        """
+        
+        # make sure rolls entered is not less than 1
+        if rolls < 1:
+            print('Roll number cannot be less than 1. Setting to default 1 and playing game.')
+            rolls = 1
+        
+        dtype = _code_dtype(len(self._faces))
+        if self._key is None:
+            streams = itertools.repeat(self._rng)
+        else:
+            streams = self._chunk_streams(rolls, chunk_size)
+        
+        # roll one chunk at a time, last chunk holds any remaining rolls
+        for start, rng in zip(range(0, rolls, chunk_size), streams):
+            yield _roll_dice(self.dice, min(chunk_size, rolls - start), rng, dtype, self._face_maps)
+
+
+    async def aplay(self, rolls, chunk_size=1_000_000, workers=None):
+        """
+        Rolls Die objects a given number of times in chunks and yields the
+        face indices of each chunk to async code, e.g.
+        `async for codes in game.aplay(rolls)`. Chunks are rolled in a
+        worker thread (or a pool of processes if workers is given) and the
+        next chunk is rolled while the current one is being consumed, so
+        the event loop is never blocked. Results are not saved to the game.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 1,000,000.
+        workers : int, optional
+            Number of worker processes. The default is None (roll in a
+            thread with the same chunks as iter_play()).
+
+        Yields
+        ------
+        codes : numpy array
+            Matrix (chunk rolls by dice) of indices into the dice faces.
+        """
+        
+        # make sure rolls entered is not less than 1
+        if rolls < 1:
+            print('Roll number cannot be less than 1. Setting to default 1 and playing game.')
+            rolls = 1
+        
+        if workers is None:
+            chunks = self.iter_play(rolls, chunk_size)
+        else:
+            chunks = self._iter_parallel(rolls, workers, chunk_size, _code_dtype(len(self._faces)))
+        
+        # always have the next chunk rolling in the default executor
+        loop = asyncio.get_running_loop()
+        pending = loop.run_in_executor(None, next, chunks, None)
+        try:
+            while True:
+                codes = await pending
+                if codes is None:
+                    return
+                pending = loop.run_in_executor(None, next, chunks, None)
+                yield codes
+        finally:
+            # let a chunk in progress finish before closing the chunks early
+            if not pending.done():
+                await asyncio.wait([pending])
+            chunks.close()
+
+
+    def _iter_parallel(self, rolls, workers, chunk_size, dtype):
+        """
+        Rolls Die objects in chunks across a pool of worker processes and
+        yields the chunks in order.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        workers : int
+            Number of worker processes, 1 plays chunks in this process.
+        chunk_size : int
+            Number of rolls per chunk.
+        dtype : numpy dtype
+            Integer dtype for the face indices.
+
+        Yields
+        ------
+        codes : numpy array
+            Matrix (chunk rolls by dice) of indices into the dice faces.
+        """
+        
+        # split rolls into chunks, each with its own independent seed
+        sizes = [chunk_size] * (rolls // chunk_size)
+        if rolls % chunk_size:
+            sizes.append(rolls % chunk_size)
+        seeds = self._chunk_streams(rolls, chunk_size)
+        
+        # build alias tables once so workers receive them with the dice
+        for d in self.dice:
+            if d._alias is None:
+                d._alias = d._build_alias()
+        
+        # play chunks and yield them in order
+        args = ([self.dice] * len(sizes), sizes, seeds, [dtype] * len(sizes),
+                [self._face_maps] * len(sizes))
+        if workers == 1:
+            yield from map(_roll_dice, *args)
+        else:
+            with futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(_roll_dice, *args)
+
+
+    def _chunk_streams(self, rolls, chunk_size):
+        """
+        Get an independent stream for each chunk of a play. Counter-based
+        games give chunk c of play p the Philox counter [0, c, p, 0], so a
+        chunk's stream can be rebuilt without drawing any earlier rolls.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of times the dice should be rolled.
+        chunk_size : int
+            Number of rolls per chunk.
+
+        Returns
+        -------
+        streams : list
+            A seed sequence or Philox bit generator for each chunk.
+        """
+        
+        n_chunks = -(-rolls // chunk_size)
+        if self._key is None:
+            return self._seed_seq.spawn(n_chunks)
+        
+        # every play moves on to new counters and is remembered for replay
+        play = self._plays
+        self._plays += 1
+        self._last_stream = (play, chunk_size, rolls)
+        streams = [self._philox(play, c) for c in range(n_chunks)]
+        
+        return streams
+
+
+    def _philox(self, play, chunk):
+        """
+        Get the Philox bit generator for one chunk of a counter-based play.
+
+        Parameters
+        ----------
+        play : int
+            Number of the counter-based play.
+        chunk : int
+            Number of the chunk within the play.
+
+        Returns
+        -------
+        bit_generator : numpy Philox
+            Bit generator starting at the counter of the chunk.
+        """
+        
+        return np.random.Philox(key=self._key, counter=[0, chunk, play, 0])
+
+
+    def replay(self, start, stop):
+        """
+        Regenerate rolls start to stop (counted from 0, stop excluded) of the
+        most recent counter-based play, from play_game() or iter_play(),
+        without replaying earlier rolls. Only the chunks holding those rolls
+        are rolled again, so the results match as long as the dice weights
+        have not changed.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first roll to regenerate.
+        stop : int
+            Index after the last roll to regenerate.
+
+        Returns
+        -------
+        results : dataframe
+            A dataframe of faces with roll number (start + 1 to stop) as
+            rows and die number as columns, as in show_results().
+            
+        Raises
+        ------
+        ValueError
+            If the game is not counter based or has not been played, or
+            the range is outside the rolls of the last play.
+        """
+        
+        if self._last_stream is None:
+            raise ValueError('Replay needs a game created with counter_based=True and played.')
+        play, chunk_size, rolls = self._last_stream
+        if not 0 <= start < stop <= rolls:
+            raise ValueError(f'Roll range must be within 0 and {rolls} rolls of the last play.')
+        
+        # roll only the chunks covering the range again and cut the range out
+        dtype = _code_dtype(len(self._faces))
+        first, last = start // chunk_size, (stop - 1) // chunk_size
+        chunks = [_roll_dice(self.dice, min(chunk_size, rolls - c * chunk_size), self._philox(play, c),
+                             dtype, self._face_maps)
+                  for c in range(first, last + 1)]
+        offset = first * chunk_size
+        codes = np.concatenate(chunks)[start - offset:stop - offset]
+        results = self._decode_results(codes=codes, start=start)
+        
+        return results
+
+
+    def _write_store(self, store, rolls, chunks, dtype):
+        """
+        Writes chunks of results to a store directory holding results.npy,
+        faces.npy and weights.npy (one row of weights per die in shared face
+        order, NaN for faces a die does not have).
+
+        Parameters
+        ----------
+        store : str
+            Directory to write results to, created if needed.
+        rolls : int
+            Total number of rolls in all chunks.
+        chunks : iterable
+            Matrices (chunk rolls by dice) of face indices in roll order.
+        dtype : numpy dtype
+            Integer dtype for the face indices.
+
+        Returns
+        -------
+        codes : numpy memmap
+            Read-only memory map of the stored results.
+        
+        Raises
+        ------
+        ValueError
+            If dice have faces of different kinds, which cannot be saved
+            without pickling.
+        """
+        
+        if self._faces.dtype == object:
+            raise ValueError('Games with faces of different kinds (e.g. numbers and strings) cannot be stored.')
+        os.makedirs(store, exist_ok=True)
+        results_path = os.path.join(store, 'results.npy')
+        temp_path = os.path.join(store, 'results.tmp.npy')
+        
+        # fill a new results file one chunk at a time
+        results = np.lib.format.open_memmap(temp_path, mode='w+', dtype=dtype,
+                                            shape=(rolls, len(self.dice)))
+        start = 0
+        for chunk in chunks:
+            results[start:start+chunk.shape[0]] = chunk
+            start += chunk.shape[0]
+        results.flush()
+        del results
+        
+        # swap the new file in, memory maps of earlier results keep the old file
+        os.replace(temp_path, results_path)
+        
+        # save faces and weights so game can be reopened without replaying it
+        np.save(os.path.join(store, 'faces.npy'), self._faces, allow_pickle=False)
+        np.save(os.path.join(store, 'weights.npy'), self._shared_weights())
+        
+        return np.load(results_path, mmap_mode='r')
+
+
+    @classmethod
+    def from_store(cls, store, seed=None):
+        """
+        Reopen a game whose results were written with play_game(store=...).
+        Dice are rebuilt from the stored faces and weights and results are
+        read lazily from a memory map.
+
+        Parameters
+        ----------
+        store : str
+            Directory results were written to.
+        seed : int, optional
+            Seed for any further game play. The default is None.
+
+        Returns
+        -------
+        game : Game object
+            Game with stored dice and results.
+        """
+        
+        # rebuild each die from the faces it has and their stored weights
+        faces = np.load(os.path.join(store, 'faces.npy'), allow_pickle=False)
+        weights = np.load(os.path.join(store, 'weights.npy'))
+        dice = cls._rebuild_dice(faces, weights)
+        
+        # attach stored results without reading them into memory
+        game = cls(dice, seed)
+        game._game_results = np.load(os.path.join(store, 'results.npy'), mmap_mode='r')
+        game._generation += 1
+        
+        return game
+
+
+    @staticmethod
+    def _rebuild_dice(faces, weights):
+        """
+        Create Die objects from shared faces and weights saved with
+        _shared_weights().
+
+        Parameters
+        ----------
+        faces : numpy array
+            Shared faces of the game.
+        weights : numpy array
+            Matrix (dice by faces) of weights, NaN for faces a die does
+            not have.
+
+        Returns
+        -------
+        dice : list
+            A list of Die objects with the saved faces and weights.
+        """
+        
+        dice = []
+        for die_weights in weights:
+            has_face = ~np.isnan(die_weights)
+            die = Die(faces[has_face])
+            die.update_weights(die_weights[has_face])
+            dice.append(die)
+        
+        return dice
+
+
+    @_profiled('Game.show_results')
+    def show_results(self, form='wide', copy=True):
+        """
+        Display dataframe of results of rolls, faces, and outcomes
+        from game play.
+
+        Parameters
+        ----------
+        form : str, optional
+            The format of how the results should be displayed. Options are
+            either 'wide' with faces as columns and roll number as rows
+            or 'narrow' with rolls and faces as multiindex rows and one column
+            with the roll outcomes. The default is 'wide'.
+        copy : bool, optional
+            If False, the dataframe shares memory with stored results
+            instead of copying them. It should be treated as read-only.
+            Use copy=False for games played with a store so results are
+            read from disk as needed rather than copied into memory.
+            The default is True.
+
+        Returns
+        -------
+        results : dataframe
+            A dataframe of the most recent results from playing
+            Game which rolls a given number of die a given number of times.
             
-            for j,d in enumerate(self.dice):
-                result = d.roll_die(1)
-                round_result[j+1] = result[0]
+        Raises
+        ------
+        ValueError
+            If given form is not 'narrow' or 'wide'.
+        """
+        
+        # if no rolls stored, advise playing game first
+        if self._game_results.shape[0] == 0:
+            print('No game has been played yet. Play game before viewing results.')
+            return
+
+        # if form is wide, decode face indices to dataframe of faces
+        if form == 'wide':
+            results = self._decode_results(copy)
+            if copy and _PROFILER is not None:
+                _PROFILER.add('copies')
+                _PROFILER.add('copied_bytes', self._game_results.nbytes)
             
-            self._game_results.loc[i] = round_result
+            return results
+
+        # if form is narrow, reuse narrow form built since last game play
+        if form == 'narrow':
+            if self._narrow is None or self._narrow[0] != self._generation:
+                self._narrow = (self._generation, self._decode_narrow())
+            results = self._narrow[1]
+            if copy:
+                results = results.copy()
+                if _PROFILER is not None:
+                    _PROFILER.add('copies')
+                    _PROFILER.add('copied_bytes', _nbytes(results))
+
+            return results
+
+        # if form is not wide or narrow, raise ValueError
+        else:
+            raise ValueError('Invalid option. Form must be "wide" or "narrow".')
+            return
+        
+        
+    def _results_view(self):
+        """
+        Get a read-only view of stored face indices without copying.
+
+        Returns
+        -------
+        codes : numpy array
+            Read-only matrix (rolls by dice) of indices into _faces.
+        """
+        
+        codes = self._game_results.view()
+        codes.flags.writeable = False
+        
+        return codes
+    
+    
+    def _probabilities(self):
+        """
+        Get the probability of each face for each die.
+
+        Returns
+        -------
+        probs : numpy array
+            Matrix (dice by faces) of face probabilities in _faces order.
+        
+        Raises
+        ------
+        ValueError
+            If a Die object has no positive weights.
+        """
+        
+        weights = np.nan_to_num(self._shared_weights())
+        totals = weights.sum(axis=1, keepdims=True)
+        if not (totals > 0).all():
+            raise ValueError('Total of Die weights must be greater than zero.')
+        
+        return weights / totals
+    
+    
+    def _shared_weights(self):
+        """
+        Get the weight of each shared face for each die.
+
+        Returns
+        -------
+        weights : numpy array
+            Matrix (dice by faces) of weights in _faces order, NaN for faces
+            a die does not have.
+        """
+        
+        weights = np.full((len(self.dice), len(self._faces)), np.nan)
+        for j, (d, face_map) in enumerate(zip(self.dice, self._face_maps)):
+            weights[j, slice(None) if face_map is None else face_map] = d.weights
+        
+        return weights
+    
+    
+    def _face_order(self):
+        """
+        Get face indices in order of face value, used to sort faces within
+        combinations by value rather than by index. Faces that cannot be
+        compared keep their shared order.
+
+        Returns
+        -------
+        order : numpy array
+            Indices into _faces from smallest to largest face.
+        """
+        
+        try:
+            return np.argsort(self._faces, kind='stable')
+        except TypeError:
+            return np.arange(len(self._faces))
+    
+    
+    def _cache_state(self):
+        """
+        Get the state that statistics computed from this game depend on.
+
+        Returns
+        -------
+        state : tuple
+            Game play generation and the weights of each die.
+        """
+        
+        return (self._generation, tuple(d.weights.tobytes() for d in self.dice))
+    
+    
+    @_profiled('Game.decode')
+    def _decode_results(self, copy=True, codes=None, start=0):
+        """
+        Decode stored face indices into a wide dataframe of faces with
+        each die column stored as a pandas Categorical.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            If False, categorical codes share memory with stored results.
+            The default is True.
+        codes : numpy array, optional
+            Face indices to decode instead of stored results. The default
+            is None.
+        start : int, optional
+            Number of rolls before the first row, for numbering rows. The
+            default is 0.
+
+        Returns
+        -------
+        results : dataframe
+            A dataframe with roll number as rows and die number as columns.
+        """
+        
+        # create row/col names for game results based on dice and roll num
+        if codes is None:
+            codes = self._results_view()
+        idx = pd.RangeIndex(start+1, start+codes.shape[0]+1, name='roll')
+        
+        # each column shares the faces as categories and keeps indices as codes
+        results = pd.DataFrame({j+1: pd.Categorical.from_codes(codes[:, j], categories=pd.Index(self._faces),
+                                                               validate=False)
+                                for j in range(codes.shape[1])},
+                               index = idx, copy = copy)
+        
+        return results
+    
+    
+    @_profiled('Game.decode')
+    def _decode_narrow(self):
+        """
+        Decode stored face indices into a narrow dataframe without copying,
+        by flattening the results in roll order.
+
+        Returns
+        -------
+        results : dataframe
+            A dataframe with roll and die number as MultiIndex rows and
+            one column of faces.
+        """
+        
+        # rows of results are contiguous so flattening gives roll then die order
+        codes = self._results_view()
+        idx = pd.MultiIndex.from_product([pd.RangeIndex(1, codes.shape[0]+1),
+                                          pd.RangeIndex(1, codes.shape[1]+1)],
+                                         names = ['roll', 'die'])
+        values = pd.Categorical.from_codes(codes.ravel(), categories=pd.Index(self._faces), validate=False)
+        results = pd.DataFrame({'value': values}, index=idx, copy=False)
+        
+        return results
+    
+    
+    def __str__(self):
+        """
+        Create string representation of class to check for
+        class type in other objects
+
+        Returns
+        -------
+        str rep of game object
+        """
+        
+        return 'Game'
+
+
+##################
+# ANALYZER CLASS #
+##################
+
+
+class Analyzer:
+
+    """
+    A class used to analyze various descriptive statistical properties
+    from results of a single Game object. Statistics are cached until the
+    game is played again or a die weight changes. Each statistic method
+    also takes copy=True; pass copy=False to get the cached result without
+    copying it, which should then be treated as read-only.
+    
+    Results of a game played with a store are read from disk in chunks of
+    CHUNK_SIZE rolls for jackpot_counts() without options,
+    face_counts('total'), combo_counts() and permutations(), so memory use
+    does not grow with the number of rolls. Other options and forms hold
+    arrays as long as the game.
+
+    Attributes
+    ----------
+    game : Game class
+        A single game class with results from recent game play.
+    _cache : dict
+        Private attribute storing computed statistics by method and arguments.
+    _cache_state : tuple
+        Private attribute for the game state the cached statistics belong to.
+
+    Methods
+    -------
+    __init__():
+        Creates initial Analyzer class object with Game object.
+    jackpot_counts():
+        Returns an integer of number of jackpots (same face each roll).
+    face_counts():
+        Returns dataframe of number of times each face was rolled.
+    combo_counts():
+        Returns dataframe of number of distinct combinations of faces rolled.
+    permutations():
+        Returns dataframe of number of distinct permutations of faces rolled.
+    vocabulary_matches():
+        Returns dataframe of permutations that spell words in a word list.
+    __str__():
+        Returns string representation of class object.
+    """    
+
+    __slots__ = ('game', '_cache', '_cache_state')
+    
+    
+    CHUNK_SIZE = 1_000_000
+    
+    
+    def __init__(self, game):
+        """
+        Initialize an Analyzer object to perform statistics on Game results
+        Takes a game object as input parameter.
+
+        Parameters
+        ----------
+        game : Game object
+            A valid Game object to perform summary statistics on.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If given game parameter is not a Game type object.
+        """
+        
+        # check that game is of game object data type
+        # try getting string representation of game class
+        try:
+            str(game)
+        # if can't get str of parameter, raise error that parameter may not be of game object type
+        except TypeError:
+            print('Cannot retrieve str rep of object. Make sure parameter is valid game object.')
+            
+        # raise ValueError if game is not of game object type 
+        if not str(game) == 'Game':
+            raise ValueError('Invalid game parameter. Must be of Game object type.')
+
+        # if no errors, assign game object to analyzer class with empty cache
+        self.game = game
+        self._cache = {}
+        self._cache_state = None
+
+        return
+
+
+    def _stored_totals(self, stat):
+        """
+        Aggregate one statistic of stored results chunk by chunk with a
+        RunningAnalyzer keeping only that statistic.
+
+        Parameters
+        ----------
+        stat : str
+            Name of the RunningAnalyzer statistic to aggregate.
+
+        Returns
+        -------
+        running : RunningAnalyzer object
+            Analyzer of all stored rolls, or None if results are in memory.
+        """
+        
+        if not isinstance(self.game._game_results, np.memmap):
+            return None
+        
+        # read one chunk of rolls from disk at a time
+        running = RunningAnalyzer(self.game, [stat])
+        codes = self.game._results_view()
+        for start in range(0, codes.shape[0], self.CHUNK_SIZE):
+            running.update(np.asarray(codes[start:start+self.CHUNK_SIZE]))
+        
+        return running
+
+
+    @_profiled('Analyzer.jackpot_counts')
+    @_memoized
+    def jackpot_counts(self, by_face=False, return_rolls=False, weighted=False):
+        """
+        Compute how many times in a game a roll resulted in which all faces
+        were the same (e.g. all die rolled a one).
+        
+        Parameters
+        ----------
+        by_face : bool, optional
+            If True, return the number of jackpots for each face instead of
+            the total. The default is False.
+        return_rolls : bool, optional
+            If True, also return the roll numbers of the jackpots. The
+            default is False.
+        weighted : bool, optional
+            If True, weight each jackpot by its likelihood ratio from an
+            importance sampled game, giving an estimate of the jackpot
+            count under the real dice weights. The default is False.
+        
+        Returns
+        -------
+        counts : int, float or dataframe
+            The number of times a roll resulted in all the same faces (jackpot),
+            a float if weighted. If by_face, a dataframe with faces as index
+            and a count column.
+        rolls : numpy array
+            Roll numbers of the jackpots, only returned if return_rolls.
+        """
+        
+        # stored results are counted in chunks when no options need every roll
+        if not (by_face or return_rolls or weighted):
+            running = self._stored_totals('jackpot_counts')
+            if running is not None:
+                return running.jackpot_counts()
+        
+        # get face indices of results from game object
+        codes = self.game._results_view()
+        first = codes[:, 0]
+        
+        # a roll is a jackpot if every die matches the first die
+        is_jackpot = np.ones(codes.shape[0], dtype=bool)
+        for j in range(1, codes.shape[1]):
+            is_jackpot &= codes[:, j] == first
+        
+        # weight jackpots by likelihood ratio of importance sampled rolls
+        weights = None
+        if weighted:
+            weights = np.ones(codes.shape[0])
+            if self.game._likelihood is not None:
+                weights = self.game._likelihood
+            weights = weights[is_jackpot]
+        
+        # count jackpots in total or for each face
+        if by_face:
+            totals = np.bincount(first[is_jackpot], weights=weights, minlength=len(self.game._faces))
+            counts = pd.DataFrame({'count': totals},
+                                  index = pd.Index(self.game._faces, name='faces'))
+        elif weighted:
+            counts = float(weights.sum())
+        else:
+            counts = int(is_jackpot.sum())
+        
+        # return roll numbers (starting at one like results) if asked
+        if return_rolls:
+            return counts, np.flatnonzero(is_jackpot) + 1
+        
+        # return total count of jackpots
+        return counts
+
+
+    @_profiled('Analyzer.face_counts')
+    @_memoized
+    def face_counts(self, form='wide'):
+        """
+        Compute the number of times each face was rolled in each round.
+
+        Parameters
+        ----------
+        form : str, optional
+            The format of the counts. Options are 'wide' with roll number as
+            rows and faces as columns, 'sparse' with the same layout stored
+            as sparse columns for dice with many faces, or 'total' with the
+            count of each face across all rolls. The default is 'wide'.
+
+        Returns
+        -------
+        face_counts : dataframe
+            Dataframe consists of the roll number (rows), face values(columns)
+            and the number of times each face value occurred in each roll.
+            For 'total', faces are rows with a single count column.
+            
+        Raises
+        ------
+        ValueError
+            If given form is not 'wide', 'sparse' or 'total'.
+        """
+        
+        # get faces and face indices of results from game object
+        faces = self.game._faces
+        codes = self.game._results_view()
+        idx = pd.RangeIndex(1, codes.shape[0]+1, name='roll')
+        
+        # if form is total, count every face index at once
+        if form == 'total':
+            running = self._stored_totals('face_counts')
+            if running is not None:
+                return running.face_counts()
+            totals = np.bincount(codes.ravel(), minlength=len(faces))
+            face_counts = pd.DataFrame({'count': totals},
+                                       index = pd.Index(faces, name='faces'))
+            
+            return face_counts
+        
+        # if form is wide, add one to the rolled face of each die in every row
+        if form == 'wide':
+            counts = np.zeros((codes.shape[0], len(faces)), dtype='int')
+            rows = np.arange(codes.shape[0])
+            for j in range(codes.shape[1]):
+                counts[rows, codes[:, j]] += 1
+            face_counts = pd.DataFrame(counts, index=idx, columns=faces)
+            
+            return face_counts
+        
+        # if form is sparse, count each (face, roll) pair once, then slice
+        # the nonzero rolls and counts of every face into its sparse column
+        if form == 'sparse':
+            from pandas._libs.sparse import IntIndex
+            n_rolls = codes.shape[0]
+            pairs = codes.astype(np.int64) * n_rolls + np.arange(n_rolls)[:, None]
+            keys, counts = np.unique(pairs.ravel(), return_counts=True)
+            bounds = np.searchsorted(keys, np.arange(len(faces)+1) * n_rolls)
+            rows = (keys % n_rolls).astype(np.int32)
+            columns = {j: pd.arrays.SparseArray(counts[bounds[j]:bounds[j+1]],
+                                                sparse_index=IntIndex(n_rolls, rows[bounds[j]:bounds[j+1]]),
+                                                fill_value=0)
+                       for j in range(len(faces))}
+            face_counts = pd.DataFrame(columns, index=idx)
+            face_counts.columns = faces
+            
+            return face_counts
+        
+        # if form is not wide, sparse or total, raise ValueError
+        else:
+            raise ValueError('Invalid option. Form must be "wide", "sparse" or "total".')
+
+
+    @_profiled('Analyzer.combo_counts')
+    @_memoized
+    def combo_counts(self):
+        """
+        Computes the unique combinations of faces rolled along with the
+        number of times that unique combination occurred.
+
+        Returns
+        -------
+        combos : dataframe
+            A dataframe consists of a MultiIndex of distinct combinations
+            with a column associated with the number of counts.
+        """
+
+        # stored results are counted in chunks
+        running = self._stored_totals('combo_counts')
+        if running is not None:
+            return running.combo_counts()
+
+        # get face indices of results from game object
+        faces = self.game._faces
+        codes = self.game._results_view()
+
+        # sort face ranks within each roll so combinations share one packed key
+        order = self.game._face_order()
+        keys = _row_keys(np.sort(np.argsort(order)[codes], axis=1), len(faces))
+
+        # count distinct keys and decode ranks back to faces
+        keys, counts = np.unique(keys, axis=0, return_counts=True)
+        combos = _counts_frame(keys, counts, faces[order], codes.shape[1])
+
+        # return dataframe with combos and counts
+        return combos
+
+
+    @_profiled('Analyzer.permutations')
+    @_memoized
+    def permutations(self):
+        """
+        Computes unique permutations of faces rolled along with the number
+        of times that unique permutation occurred.
+
+        Returns
+        -------
+        perms : dataframe
+            A dataframe consisting of a MultiIndex of distinct permutations
+            with a column associated with the number of counts.
+        """
+        
+        # stored results are counted in chunks
+        running = self._stored_totals('permutations')
+        if running is not None:
+            return running.permutations()
+        
+        # get face indices of results from game object
+        faces = self.game._faces
+        codes = self.game._results_view()
+        
+        # pack each roll in die order into one key
+        keys = _row_keys(codes, len(faces))
+        
+        # count distinct keys and decode them back to faces
+        keys, counts = np.unique(keys, axis=0, return_counts=True)
+        perms = _counts_frame(keys, counts, faces, codes.shape[1])
+        
+        # return dataframe with permutations and counts
+        return perms
+    
+    
+    @_profiled('Analyzer.vocabulary_matches')
+    @_memoized
+    def vocabulary_matches(self, vocab_path, index_path=None):
+        """
+        Find the distinct permutations of faces rolled that spell a word in
+        a word list (one word per line), along with the number of times each
+        was rolled. Faces of each roll are joined in die order and compared
+        to words exactly as written.
+
+        Parameters
+        ----------
+        vocab_path : str
+            Path to word list such as scrabble_words.txt.
+        index_path : str, optional
+            Path to a .npy index of the sorted word list, created on first
+            use and memory mapped afterwards. The default is None.
+
+        Returns
+        -------
+        matches : dataframe
+            A dataframe with matching words as index and a column of
+            counts, sorted from most to least frequent.
+        """
+        
+        # load sorted word list, cached across calls
+        vocab = _load_vocabulary(vocab_path, index_path)
+        
+        # get distinct permutations of face indices and their counts
+        faces = self.game._faces.astype(str)
+        codes = self.game._results_view()
+        keys, counts = np.unique(_row_keys(codes, len(faces)), axis=0, return_counts=True)
+        rows = _key_rows(keys, len(faces), codes.shape[1])
+        
+        # spell each distinct permutation by joining faces of every die
+        words = faces[rows[:, 0]]
+        for j in range(1, rows.shape[1]):
+            words = np.char.add(words, faces[rows[:, j]])
+        
+        # look up all words at once in sorted word list
+        found = np.zeros(len(words), dtype=bool)
+        if len(vocab) > 0:
+            idx = np.minimum(np.searchsorted(vocab, words), len(vocab)-1)
+            found = vocab[idx] == words
+        
+        # order matches from most to least frequent
+        order = np.argsort(-counts[found], kind='stable')
+        matches = pd.DataFrame({'count': counts[found][order].astype(np.int64)},
+                               index = pd.Index(words[found][order], name='word'))
+        
+        return matches
+    
+    
+    def __str__(self):
+        """
+        Create string representation of class to check for
+        class type in other objects
+
+        Returns
+        -------
+        str rep of analyzer object
+        """
+        
+        return 'Analyzer'
+
+
+##########################
+# RUNNING ANALYZER CLASS #
+##########################
+
+
+class RunningAnalyzer:
+
+    """
+    A class used to analyze a Game object played in chunks. Aggregates are
+    updated as each chunk is rolled so only running totals are kept,
+    allowing games far larger than memory and stopping early.
+
+    Attributes
+    ----------
+    game : Game class
+        A single game class to be played in chunks.
+    rolls : int
+        Number of rolls analyzed so far.
+    stats : list
+        Names of aggregates kept, from 'jackpot_counts', 'face_counts',
+        'combo_counts' and 'permutations'. Distinct combination and
+        permutation tables grow with the number of distinct rolls, so
+        leave them out to keep memory bounded for games with many faces.
+    _jackpots : int
+        Private attribute for running count of jackpots.
+    _face_totals : numpy array
+        Private attribute for running count of each face.
+    _combos : tuple
+        Private attribute for distinct combination keys and counts, keyed
+        by face ranks sorted within each roll.
+    _perms : tuple
+        Private attribute for distinct permutation keys and counts.
+
+    Methods
+    -------
+    __init__():
+        Creates initial RunningAnalyzer class object with Game object.
+    update():
+        Adds a chunk of game results to the running aggregates.
+    play():
+        Plays game in chunks and updates aggregates after each chunk.
+    play_until():
+        Plays game in chunks until an estimate is precise enough.
+    merge():
+        Returns analyzer combining the aggregates of two analyzers.
+    save():
+        Writes aggregates and dice to a compressed file.
+    load():
+        Creates class object from a file written by save().
+    jackpot_counts():
+        Returns an integer of number of jackpots (same face each roll).
+    face_counts():
+        Returns dataframe of total number of times each face was rolled.
+    combo_counts():
+        Returns dataframe of number of distinct combinations of faces rolled.
+    permutations():
+        Returns dataframe of number of distinct permutations of faces rolled.
+    __str__():
+        Returns string representation of class object.
+    """
+
+    __slots__ = ('game', 'rolls', 'stats', '_jackpots', '_face_totals', '_combos', '_perms')
+    
+    
+    STATS = ['jackpot_counts', 'face_counts', 'combo_counts', 'permutations']
+    
+    
+    def __init__(self, game, stats=None):
+        """
+        Initialize a RunningAnalyzer object with empty aggregates for
+        a given Game object.
+
+        Parameters
+        ----------
+        game : Game object
+            A valid Game object to be played and analyzed in chunks.
+        stats : list, optional
+            Names of aggregates to keep. The default is None (all of
+            STATS).
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If given game parameter is not a Game type object or a
+            statistic is unknown.
+        """
+        
+        # raise ValueError if game is not of game object type
+        if not str(game) == 'Game':
+            raise ValueError('Invalid game parameter. Must be of Game object type.')
+        
+        # raise ValueError if stats are not valid
+        stats = self.STATS if stats is None else list(stats)
+        for stat in stats:
+            if stat not in self.STATS:
+                raise ValueError(f'Invalid statistic {stat!r}. Options are {self.STATS}.')
+        
+        # if no errors, assign game and create empty aggregates
+        self.game = game
+        self.rolls = 0
+        self.stats = [stat for stat in self.STATS if stat in stats]
+        self._jackpots = 0
+        self._face_totals = np.zeros(len(game._faces), dtype=np.int64)
+        empty = _row_keys(np.empty((0, len(game.dice)), dtype=np.intp), len(game._faces))
+        self._combos = (empty, np.zeros(0, dtype=np.int64))
+        self._perms = (empty, np.zeros(0, dtype=np.int64))
+        
+        return
+
+
+    @_profiled('RunningAnalyzer.update')
+    def update(self, codes):
+        """
+        Add a chunk of game results to the running aggregates.
+
+        Parameters
+        ----------
+        codes : numpy array
+            Matrix (rolls by dice) of face indices, as yielded by
+            Game.iter_play().
+
+        Returns
+        -------
+        None.
+        """
+        
+        n_faces = len(self.game._faces)
+        
+        # jackpots are rows where every die matches the first die
+        if 'jackpot_counts' in self.stats:
+            self._jackpots += int((codes == codes[:, :1]).all(axis=1).sum())
+        if 'face_counts' in self.stats:
+            self._face_totals += np.bincount(codes.ravel(), minlength=n_faces)
+        
+        # count distinct permutations and combinations (sorted face ranks) in chunk then merge
+        if 'permutations' in self.stats:
+            keys, counts = np.unique(_row_keys(codes, n_faces), axis=0, return_counts=True)
+            self._perms = _merge_counts(*self._perms, keys, counts)
+        if 'combo_counts' in self.stats:
+            ranks = np.sort(np.argsort(self.game._face_order())[codes], axis=1)
+            keys, counts = np.unique(_row_keys(ranks, n_faces), axis=0, return_counts=True)
+            self._combos = _merge_counts(*self._combos, keys, counts)
+        
+        self.rolls += codes.shape[0]
+        
+        return
+
+
+    def play(self, rolls, chunk_size=1_000_000, stop=None):
+        """
+        Play the game in chunks, updating aggregates after each chunk.
+
+        Parameters
+        ----------
+        rolls : int
+            Maximum number of times the dice should be rolled.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 1,000,000.
+        stop : callable, optional
+            Called with this analyzer after each chunk, the game stops early
+            when it returns True. The default is None (play all rolls).
+
+        Returns
+        -------
+        None.
+        """
+        
+        # update after every chunk and check whether to stop early
+        for codes in self.game.iter_play(rolls, chunk_size):
+            self.update(codes)
+            if stop is not None and stop(self):
+                break
+        
+        return
+
+
+    def play_until(self, width, statistic='jackpot', face=None, confidence=0.95,
+                   relative=False, chunk_size=100_000, max_rolls=10**9):
+        """
+        Play the game in chunks until the confidence interval of a rate
+        is narrower than a given width. Intervals are Wilson score
+        intervals, which stay valid for rare events such as jackpots.
+        
+        Only the counter being estimated is updated, so memory does not
+        grow however many rolls are needed. Other aggregates would no
+        longer cover every roll, so they are dropped from stats.
+
+        Parameters
+        ----------
+        width : float
+            Target width of the confidence interval.
+        statistic : str, optional
+            Either 'jackpot' for the rate of jackpots per roll or 'face' for
+            the rate a face is rolled per die. The default is 'jackpot'.
+        face : int, float, or str, optional
+            Face to estimate when statistic is 'face'. The default is None.
+        confidence : float, optional
+            Confidence level of the interval. The default is 0.95.
+        relative : bool, optional
+            If True, width is relative to the estimate (e.g. 0.1 for within
+            10 percent). The default is False.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 100,000.
+        max_rolls : int, optional
+            Most rolls to play in this call before giving up. The default
+            is 10**9.
+
+        Returns
+        -------
+        history : dataframe
+            The estimate and interval after each chunk, with total rolls
+            played as index. The last row holds the final estimate.
+        
+        Raises
+        ------
+        ValueError
+            If statistic is not 'jackpot' or 'face', face is not a face
+            of the game, or the counter being estimated is not kept.
+        """
+        
+        # check statistic and find index of face to estimate
+        if statistic not in ('jackpot', 'face'):
+            raise ValueError('Invalid option. Statistic must be "jackpot" or "face".')
+        if statistic == 'face':
+            if not np.isin(face, self.game._faces):
+                raise ValueError('Face not found in game faces.')
+            face_idx = np.flatnonzero(self.game._faces == face)[0]
+        z = statistics.NormalDist().inv_cdf(0.5 + confidence/2)
+        
+        # keep only the counter being estimated from here on
+        needed = 'jackpot_counts' if statistic == 'jackpot' else 'face_counts'
+        self._check_stat(needed)
+        self.stats = [needed]
+        empty = _row_keys(np.empty((0, len(self.game.dice)), dtype=np.intp), len(self.game._faces))
+        self._combos = (empty, np.zeros(0, dtype=np.int64))
+        self._perms = (empty, np.zeros(0, dtype=np.int64))
+        
+        # play chunks and record interval after each one
+        history = []
+        for codes in self.game.iter_play(max_rolls, chunk_size):
+            self.update(codes)
+            
+            # successes and trials of the rate being estimated
+            if statistic == 'jackpot':
+                hits, trials = self._jackpots, self.rolls
+            else:
+                hits, trials = self._face_totals[face_idx], self.rolls * len(self.game.dice)
+            
+            # wilson score interval around the observed rate
+            rate = hits / trials
+            center = (rate + z**2 / (2*trials)) / (1 + z**2 / trials)
+            half = z / (1 + z**2 / trials) * math.sqrt(rate * (1-rate) / trials + z**2 / (4*trials**2))
+            history.append({'rolls': self.rolls, 'estimate': rate,
+                            'lower': center - half, 'upper': center + half})
+            
+            # stop once interval is narrow enough
+            target = width * rate if relative else width
+            if 2*half <= target:
+                break
+        
+        history = pd.DataFrame(history).set_index('rolls')
+        
+        return history
+
+
+    def merge(self, other):
+        """
+        Combine the aggregates of this analyzer with another analyzer of
+        the same game configuration, such as shards played on other
+        machines or processes. Merging is associative and commutative, so
+        shards can be combined in any order.
+
+        Parameters
+        ----------
+        other : RunningAnalyzer object
+            Analyzer of a game with the same faces, number of dice and
+            weights, keeping the same aggregates.
+
+        Returns
+        -------
+        merged : RunningAnalyzer object
+            New analyzer of this analyzer's game holding the combined
+            aggregates. Neither analyzer is changed.
+        
+        Raises
+        ------
+        ValueError
+            If other is not a RunningAnalyzer, its game has different
+            faces, number of dice or weights, or it keeps different
+            aggregates.
+        """
+        
+        # only analyzers of the same dice can be combined
+        if not str(other) == 'RunningAnalyzer':
+            raise ValueError('Invalid other parameter. Must be of RunningAnalyzer object type.')
+        if not (np.array_equal(self.game._faces, other.game._faces)
+                and np.array_equal(self.game._shared_weights(), other.game._shared_weights(),
+                                   equal_nan=True)):
+            raise ValueError('Analyzers must be of games with the same faces, number of dice and weights.')
+        if self.stats != other.stats:
+            raise ValueError('Analyzers must keep the same statistics.')
+        
+        # add counts, distinct keys of both analyzers are combined
+        merged = RunningAnalyzer(self.game, self.stats)
+        merged.rolls = self.rolls + other.rolls
+        merged._jackpots = self._jackpots + other._jackpots
+        merged._face_totals = self._face_totals + other._face_totals
+        merged._combos = _merge_counts(*self._combos, *other._combos)
+        merged._perms = _merge_counts(*self._perms, *other._perms)
+        
+        return merged
+
+
+    def save(self, path):
+        """
+        Write the aggregates along with the faces and weights of the dice
+        to a compressed .npz file, without any roll results.
+
+        Parameters
+        ----------
+        path : str
+            File to write, '.npz' is added if missing.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If dice have faces of different kinds, which cannot be saved
+            without pickling.
+        """
+        
+        if self.game._faces.dtype == object:
+            raise ValueError('Games with faces of different kinds (e.g. numbers and strings) cannot be saved.')
+        np.savez_compressed(path, faces=self.game._faces, weights=self.game._shared_weights(),
+                            stats=np.array(self.stats), rolls=self.rolls, jackpots=self._jackpots,
+                            face_totals=self._face_totals,
+                            combo_keys=self._combos[0], combo_counts=self._combos[1],
+                            perm_keys=self._perms[0], perm_counts=self._perms[1])
+        
+        return
+
+
+    @classmethod
+    def load(cls, path, seed=None):
+        """
+        Create a RunningAnalyzer from a file written by save(). Its game is
+        rebuilt from the saved faces and weights, so loaded analyzers can be
+        merged or played further.
+
+        Parameters
+        ----------
+        path : str
+            File written by save().
+        seed : int, optional
+            Seed for any further game play. The default is None.
+
+        Returns
+        -------
+        analyzer : RunningAnalyzer object
+            Analyzer with the saved aggregates.
+        """
+        
+        # rebuild game from saved dice, then restore aggregates
+        with np.load(path, allow_pickle=False) as data:
+            game = Game(Game._rebuild_dice(data['faces'], data['weights']), seed)
+            analyzer = cls(game, data['stats'].tolist())
+            analyzer.rolls = int(data['rolls'])
+            analyzer._jackpots = int(data['jackpots'])
+            analyzer._face_totals = data['face_totals']
+            analyzer._combos = (data['combo_keys'], data['combo_counts'])
+            analyzer._perms = (data['perm_keys'], data['perm_counts'])
+        
+        return analyzer
+
+
+    def jackpot_counts(self):
+        """
+        Running count of rolls in which all faces were the same.
+
+        Returns
+        -------
+        counts : int
+            The number of times a roll resulted in all the same faces (jackpot).
+        """
+        
+        self._check_stat('jackpot_counts')
+        
+        return self._jackpots
+
+
+    def face_counts(self):
+        """
+        Running count of the number of times each face was rolled across
+        all rolls and dice.
+
+        Returns
+        -------
+        face_counts : dataframe
+            Dataframe with faces as index and a count column.
+        """
+        
+        self._check_stat('face_counts')
+        face_counts = pd.DataFrame({'count': self._face_totals.copy()},
+                                   index = pd.Index(self.game._faces, name='faces'))
+        
+        return face_counts
+
+
+    def combo_counts(self):
+        """
+        Running count of distinct combinations of faces rolled.
+
+        Returns
+        -------
+        combos : dataframe
+            A dataframe consists of a MultiIndex of distinct combinations
+            with a column associated with the number of counts.
+        """
+        
+        self._check_stat('combo_counts')
+        combos = _counts_frame(*self._combos, self.game._faces[self.game._face_order()],
+                               len(self.game.dice))
+        
+        return combos
+
+
+    def permutations(self):
+        """
+        Running count of distinct permutations of faces rolled.
+
+        Returns
+        -------
+        perms : dataframe
+            A dataframe consisting of a MultiIndex of distinct permutations
+            with a column associated with the number of counts.
+        """
+        
+        self._check_stat('permutations')
+        perms = _counts_frame(*self._perms, self.game._faces, len(self.game.dice))
+        
+        return perms
+    
+    
+    def _check_stat(self, stat):
+        """
+        Make sure an aggregate is kept before it is returned.
+
+        Parameters
+        ----------
+        stat : str
+            Name of the aggregate.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If the aggregate is not in stats.
+        """
+        
+        if stat not in self.stats:
+            raise ValueError(f'Statistic {stat!r} is not kept by this analyzer. Kept statistics are {self.stats}.')
+        
+        return
+    
+    
+    def __str__(self):
+        """
+        Create string representation of class to check for
+        class type in other objects
+
+        Returns
+        -------
+        str rep of running analyzer object
+        """
+        
+        return 'RunningAnalyzer'
+
+
+#########################
+# SKETCH ANALYZER CLASS #
+#########################
+
+
+class SketchAnalyzer:
+
+    """
+    A class used to estimate permutation statistics of a Game object
+    played in chunks, in fixed memory however many distinct permutations
+    are rolled. Each permutation is packed into a 64 bit key and fed to
+    three sketches: a Count-Min sketch for the frequency of any
+    permutation, a HyperLogLog for the number of distinct permutations and
+    a Space-Saving summary for the most frequent permutations.
+
+    Attributes
+    ----------
+    game : Game class
+        A single game class to be played in chunks.
+    rolls : int
+        Number of rolls analyzed so far.
+    _salts : numpy array
+        Private attribute for the salt of each Count-Min row hash.
+    _cms : numpy array
+        Private attribute for the Count-Min table (depth by width).
+    _hll : numpy array
+        Private attribute for the HyperLogLog registers.
+    _top : tuple
+        Private attribute for the Space-Saving keys, counts and errors.
+    _top_k : int
+        Private attribute for the number of Space-Saving counters.
+
+    Methods
+    -------
+    __init__():
+        Creates initial SketchAnalyzer class object with Game object.
+    update():
+        Adds a chunk of game results to the sketches.
+    play():
+        Plays game in chunks and updates sketches after each chunk.
+    permutations():
+        Returns dataframe of most frequent permutations with error bounds.
+    permutation_count():
+        Returns estimated count of one permutation with error bound.
+    distinct_permutations():
+        Returns estimated number of distinct permutations with standard error.
+    __str__():
+        Returns string representation of class object.
+    """
+
+    __slots__ = ('game', 'rolls', '_salts', '_cms', '_hll', '_top', '_top_k')
+    
+    
+    def __init__(self, game, width=2**16, depth=4, precision=14, top_k=100, seed=0):
+        """
+        Initialize a SketchAnalyzer object with empty sketches for a given
+        Game object.
+
+        Parameters
+        ----------
+        game : Game object
+            A valid Game object to be played and analyzed in chunks.
+        width : int, optional
+            Counters per Count-Min row. Counts are overestimated by at most
+            e / width of all rolls. The default is 2**16.
+        depth : int, optional
+            Count-Min rows. The bound fails with probability exp(-depth).
+            The default is 4.
+        precision : int, optional
+            HyperLogLog uses 2**precision registers, with a relative
+            standard error of 1.04 / sqrt(2**precision). The default is 14.
+        top_k : int, optional
+            Space-Saving counters for the most frequent permutations. The
+            default is 100.
+        seed : int, optional
+            Seed for the Count-Min hash salts. The default is 0.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If given game parameter is not a Game type object, or its
+            permutations cannot be packed into 64 bit keys.
+        """
+        
+        # raise ValueError if game is not of game object type or too large to pack
+        if not str(game) == 'Game':
+            raise ValueError('Invalid game parameter. Must be of Game object type.')
+        if len(game._faces) ** len(game.dice) > 2 ** 64:
+            raise ValueError('Game has too many permutations to pack into 64 bit keys.')
+        
+        # if no errors, assign game and create empty sketches
+        self.game = game
+        self.rolls = 0
+        self._salts = np.random.SeedSequence(seed).generate_state(depth, np.uint64)
+        self._cms = np.zeros((depth, width), dtype=np.int64)
+        self._hll = np.zeros(2 ** precision, dtype=np.uint8)
+        self._top = (np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64),
+                     np.zeros(0, dtype=np.int64))
+        self._top_k = top_k
+        
+        return
+
+
+    @_profiled('SketchAnalyzer.update')
+    def update(self, codes):
+        """
+        Add a chunk of game results to the sketches.
+
+        Parameters
+        ----------
+        codes : numpy array
+            Matrix (rolls by dice) of face indices, as yielded by
+            Game.iter_play().
+
+        Returns
+        -------
+        None.
+        """
+        
+        # count distinct permutations in chunk first so each sketch sees each key once
+        keys, counts = np.unique(_row_keys(codes, len(self.game._faces)), return_counts=True)
+        
+        # count-min, add counts to one hashed column in every row
+        width = self._cms.shape[1]
+        for row, salt in enumerate(self._salts):
+            cols = _splitmix64(keys ^ salt) % np.uint64(width)
+            self._cms[row] += np.bincount(cols.astype(np.intp), weights=counts,
+                                          minlength=width).astype(np.int64)
+        
+        # hyperloglog, first bits of hash pick a register, rest give rank of first one bit
+        precision = int(np.log2(len(self._hll)))
+        hashes = _splitmix64(keys)
+        registers = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+        rest = hashes << np.uint64(precision)
+        high = rest >> np.uint64(11)
+        bit_length = np.where(high > 0, np.frexp(high.astype(float))[1] + 11,
+                              np.frexp(rest.astype(float))[1])
+        ranks = np.minimum(64 - bit_length + 1, 64 - precision + 1).astype(np.uint8)
+        np.maximum.at(self._hll, registers, ranks)
+        
+        # space-saving, merge chunk counts into summary and keep top_k
+        self._top = self._merge_top(self._top, keys, counts)
+        self.rolls += codes.shape[0]
+        
+        return
+
+
+    def _merge_top(self, top, keys, counts):
+        """
+        Merge exact counts of a chunk into a Space-Saving summary. Keys
+        missing from a full summary may have been counted up to its
+        smallest count, which is added to their count and error.
+
+        Parameters
+        ----------
+        top : tuple
+            Sorted keys, counts and errors of the summary.
+        keys : numpy array
+            Sorted distinct keys of the chunk.
+        counts : numpy array
+            Exact count of each chunk key.
+
+        Returns
+        -------
+        top : tuple
+            Sorted keys, counts and errors of at most top_k keys.
+        """
+        
+        top_keys, top_counts, top_errors = top
+        floor = top_counts.min() if len(top_keys) == self._top_k else 0
+        
+        # chunk keys get the summary's floor unless the summary holds them
+        all_keys = np.union1d(top_keys, keys)
+        all_counts = np.full(len(all_keys), floor, dtype=np.int64)
+        all_errors = np.full(len(all_keys), floor, dtype=np.int64)
+        in_top = np.searchsorted(all_keys, top_keys)
+        all_counts[in_top] = top_counts
+        all_errors[in_top] = top_errors
+        all_counts[np.searchsorted(all_keys, keys)] += counts
+        
+        # keep the largest counts, in key order
+        if len(all_keys) > self._top_k:
+            keep = np.sort(np.argpartition(-all_counts, self._top_k - 1)[:self._top_k])
+            all_keys, all_counts, all_errors = all_keys[keep], all_counts[keep], all_errors[keep]
+        
+        return all_keys, all_counts, all_errors
+
+
+    def play(self, rolls, chunk_size=1_000_000, stop=None):
+        """
+        Play the game in chunks, updating sketches after each chunk.
+
+        Parameters
+        ----------
+        rolls : int
+            Maximum number of times the dice should be rolled.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 1,000,000.
+        stop : callable, optional
+            Called with this analyzer after each chunk, the game stops early
+            when it returns True. The default is None (play all rolls).
+
+        Returns
+        -------
+        None.
+        """
+        
+        # update after every chunk and check whether to stop early
+        for codes in self.game.iter_play(rolls, chunk_size):
+            self.update(codes)
+            if stop is not None and stop(self):
+                break
+        
+        return
+
+
+    def permutations(self, top=None):
+        """
+        Estimate the most frequent permutations of faces rolled. Counts are
+        never below the true count and exceed it by at most the error, which
+        is at most rolls / top_k.
+
+        Parameters
+        ----------
+        top : int, optional
+            Number of permutations to return. The default is None (all
+            top_k tracked permutations).
+
+        Returns
+        -------
+        perms : dataframe
+            A dataframe consisting of a MultiIndex of permutations with
+            count and error columns, from most to least frequent.
+        """
+        
+        keys, counts, errors = self._top
+        n_dice = len(self.game.dice)
+        perms = _counts_frame(keys, counts, self.game._faces, n_dice)
+        
+        # errors follow the same most to least frequent order as counts
+        perms['error'] = errors[np.argsort(-counts, kind='stable')]
+        
+        return perms.iloc[:top]
+
+
+    def permutation_count(self, permutation):
+        """
+        Estimate how many times one permutation of faces was rolled. The
+        estimate is never below the true count and exceeds it by at most
+        the error, with probability 1 - exp(-depth).
+
+        Parameters
+        ----------
+        permutation : tuple
+            One face for each die, in die order.
+
+        Returns
+        -------
+        count : int
+            Estimated number of times the permutation was rolled.
+        error : int
+            Bound on how much the count overestimates the true count.
+        
+        Raises
+        ------
+        ValueError
+            If permutation does not have one face of the game per die.
+        """
+        
+        # look up face indices and pack them like rolled permutations
+        faces = self.game._faces
+        positions = {face: i for i, face in enumerate(faces.tolist())}
+        if len(permutation) != len(self.game.dice) or not all(face in positions for face in permutation):
+            raise ValueError('Permutation must have one face of the game for each die.')
+        codes = np.array([[positions[face] for face in permutation]])
+        key = _row_keys(codes, len(faces))
+        
+        # smallest counter across rows is the tightest overestimate
+        width = self._cms.shape[1]
+        cols = [int((_splitmix64(key ^ salt) % np.uint64(width))[0]) for salt in self._salts]
+        count = int(min(self._cms[row, col] for row, col in enumerate(cols)))
+        error = math.ceil(math.e / width * self.rolls)
+        
+        return count, error
+
+
+    def distinct_permutations(self):
+        """
+        Estimate the number of distinct permutations of faces rolled.
+
+        Returns
+        -------
+        distinct : float
+            Estimated number of distinct permutations.
+        error : float
+            Standard error of the estimate.
+        """
+        
+        m = len(self._hll)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        distinct = alpha * m**2 / np.sum(np.ldexp(1.0, -self._hll.astype(int)))
+        
+        # linear counting is more accurate while many registers are empty
+        empty = int(np.sum(self._hll == 0))
+        if distinct <= 2.5 * m and empty > 0:
+            distinct = m * math.log(m / empty)
+        error = distinct * 1.04 / math.sqrt(m)
+        
+        return float(distinct), float(error)
+    
+    
+    def __str__(self):
+        """
+        Create string representation of class to check for
+        class type in other objects
+
+        Returns
+        -------
+        str rep of sketch analyzer object
+        """
+        
+        return 'SketchAnalyzer'
+
+
+########################
+# EXACT ANALYZER CLASS #
+########################
+
+
+class ExactAnalyzer:
+
+    """
+    A class used to compute the exact distributions that an Analyzer
+    estimates by simulation, directly from the weights of the dice in a
+    Game object. Results have the same layout as Analyzer results with
+    expected counts in place of observed counts, so simulations can be
+    checked against them or skipped for small games.
+
+    Attributes
+    ----------
+    game : Game class
+        A single game class whose dice weights are analyzed.
+
+    Methods
+    -------
+    __init__():
+        Creates initial ExactAnalyzer class object with Game object.
+    jackpot_counts():
+        Returns expected number of jackpots (same face each roll).
+    face_counts():
+        Returns dataframe of expected number of times each face is rolled.
+    face_count_distribution():
+        Returns dataframe of probability of each face appearing k times in a roll.
+    combo_counts():
+        Returns dataframe of probability and expected count of each combination.
+    permutations():
+        Returns dataframe of probability and expected count of each permutation.
+    __str__():
+        Returns string representation of class object.
+    """
+
+    __slots__ = ('game',)
+    
+    
+    def __init__(self, game):
+        """
+        Initialize an ExactAnalyzer object for a given Game object.
+
+        Parameters
+        ----------
+        game : Game object
+            A valid Game object whose dice are analyzed.
+
+        Returns
+        -------
+        None.
+        
+        Raises
+        ------
+        ValueError
+            If given game parameter is not a Game type object.
+        """
+        
+        # raise ValueError if game is not of game object type
+        if not str(game) == 'Game':
+            raise ValueError('Invalid game parameter. Must be of Game object type.')
+        
+        # if no errors, assign game object to analyzer class
+        self.game = game
+        
+        return
+
+
+    def _rolls(self, rolls):
+        """
+        Get number of rolls to scale probabilities to expected counts.
+
+        Parameters
+        ----------
+        rolls : int or None
+            Requested number of rolls.
+
+        Returns
+        -------
+        rolls : int
+            Requested rolls, else rolls in the last game played, else 1.
+        """
+        
+        if rolls is None:
+            rolls = max(self.game._game_results.shape[0], 1)
+        
+        return rolls
+
+
+    def jackpot_counts(self, rolls=None):
+        """
+        Compute expected number of rolls in which all faces are the same.
+
+        Parameters
+        ----------
+        rolls : int, optional
+            Number of rolls to scale to. The default is None (rolls in the
+            last game played, or 1 to give the probability of a jackpot).
+
+        Returns
+        -------
+        counts : float
+            Expected number of jackpots.
+        """
+        
+        # a jackpot on a face needs every die to roll that face
+        probs = self.game._probabilities()
+        counts = float(probs.prod(axis=0).sum() * self._rolls(rolls))
+        
+        return counts
+
+
+    def face_counts(self, rolls=None):
+        """
+        Compute expected number of times each face is rolled across all
+        rolls and dice.
+
+        Parameters
+        ----------
+        rolls : int, optional
+            Number of rolls to scale to. The default is None (rolls in the
+            last game played, or 1).
+
+        Returns
+        -------
+        face_counts : dataframe
+            Dataframe with faces as index and an expected count column.
+        """
+        
+        probs = self.game._probabilities()
+        face_counts = pd.DataFrame({'count': probs.sum(axis=0) * self._rolls(rolls)},
+                                   index = pd.Index(self.game._faces, name='faces'))
+        
+        return face_counts
 
-        return
 
+    def face_count_distribution(self):
+        """
+        Compute the probability that each face appears exactly k times in
+        a single roll of all dice. Each die contributes a polynomial
+        (1 - p) + p x for a face, and the product of these polynomials gives
+        the distribution of the number of dice showing that face.
 
-    def show_results(self, form='wide'):
+        Returns
+        -------
+        dist : dataframe
+            Dataframe with faces as rows, k = 0 to number of dice as columns
+            and probabilities as values.
         """
-        Display dataframe of results of rolls, faces, and outcomes
-        from game play.
+        
+        # multiply polynomials of every die for each face
+        probs = self.game._probabilities()
+        dist = np.zeros((probs.shape[1], probs.shape[0]+1))
+        for f in range(probs.shape[1]):
+            poly = np.ones(1)
+            for p in probs[:, f]:
+                poly = np.convolve(poly, [1-p, p])
+            dist[f] = poly
+        
+        dist = pd.DataFrame(dist, index=pd.Index(self.game._faces, name='faces'),
+                            columns=pd.RangeIndex(probs.shape[0]+1, name='k'))
+        
+        return dist
+
+
+    def _outcomes_frame(self, rows, probs, rolls):
+        """
+        Create a dataframe of outcomes with probabilities and expected counts.
 
         Parameters
         ----------
-        form : str, optional
-            The format of how the results should be displayed. Options are
-            either 'wide' with faces as columns and roll number as rows
-            or 'narrow' with rolls and faces as multiindex rows and one column
-            with the roll outcomes. The default is 'wide'.
+        rows : numpy array
+            Matrix (outcomes by dice) of face indices.
+        probs : numpy array
+            Probability of each outcome.
+        rolls : int or None
+            Number of rolls to scale to.
 
         Returns
         -------
-        results : dataframe
-            A dataframe of the most recent results from playing
-            Game which rolls a given number of die a given number of times.
-            
+        frame : dataframe
+            Dataframe with a MultiIndex of outcomes and probability and count
+            columns, sorted from most to least likely.
+        """
+        
+        # order from most to least likely, ties stay in face order
+        order = np.argsort(-probs, kind='stable')
+        rows, probs = rows[order], probs[order]
+        faces = self.game._faces
+        
+        idx = pd.MultiIndex.from_arrays([faces[rows[:, j]] for j in range(rows.shape[1])],
+                                        names = list(range(rows.shape[1])))
+        frame = pd.DataFrame({'probability': probs, 'count': probs * self._rolls(rolls)},
+                             index = idx)
+        
+        return frame
+
+
+    def _enumerate_permutations(self, max_outcomes):
+        """
+        Enumerate every permutation of faces with nonzero probability.
+
+        Parameters
+        ----------
+        max_outcomes : int
+            Largest number of outcomes to enumerate.
+
+        Returns
+        -------
+        rows : numpy array
+            Matrix (permutations by dice) of face indices.
+        perm_probs : numpy array
+            Probability of each permutation.
+        
         Raises
         ------
         ValueError
-            If given form is not 'narrow' or 'wide'.
+            If there are more than max_outcomes possible permutations.
         """
         
-        # get copy of private dataframe to format for output
-        results = self._game_results.copy(deep=True)
+        probs = self.game._probabilities()
+        supports = [np.flatnonzero(p) for p in probs]
         
-        # if dataframe is empty, advise playing game first
-        if results.empty:
-            print('No game has been played yet. Play game before viewing results.')
-            return
+        # check size before expanding outcomes
+        n_outcomes = math.prod(len(support) for support in supports)
+        if n_outcomes > max_outcomes:
+            raise ValueError(f'Game has {n_outcomes} permutations, more than max_outcomes={max_outcomes}.')
+        
+        # expand outcomes one die at a time over faces that die can roll
+        rows = np.zeros((1, 0), dtype=np.intp)
+        perm_probs = np.ones(1)
+        for p, support in zip(probs, supports):
+            rows = np.hstack([np.repeat(rows, len(support), axis=0),
+                              np.tile(support, len(rows))[:, None]])
+            perm_probs = np.outer(perm_probs, p[support]).ravel()
+        
+        return rows, perm_probs
 
-        # if form is wide, just return results
-        if form == 'wide':
-            
-            return results
 
-        # if form is narrow, format dataframe and return narrow form
-        if form == 'narrow':
-            results = pd.DataFrame(results.stack())
-            results.index.set_names(names='roll', level=0, inplace=True)
-            results.index.set_names(names='die', level=1, inplace=True)
-            results.rename(columns={0:'value'}, inplace=True)
+    def permutations(self, rolls=None, max_outcomes=1_000_000):
+        """
+        Compute the probability and expected count of every permutation of
+        faces with nonzero probability. Faces a die cannot roll are pruned
+        before outcomes are expanded.
 
-            return results
+        Parameters
+        ----------
+        rolls : int, optional
+            Number of rolls to scale to. The default is None (rolls in the
+            last game played, or 1).
+        max_outcomes : int, optional
+            Largest number of outcomes to enumerate. The default is 1,000,000.
 
-        # if form is not wide or narrow, raise ValueError
-        else:
-            raise ValueError('Invalid option. Form must be "wide" or "narrow".')
-            return
+        Returns
+        -------
+        perms : dataframe
+            A dataframe consisting of a MultiIndex of permutations with
+            probability and expected count columns.
+        
+        Raises
+        ------
+        ValueError
+            If there are more than max_outcomes possible permutations.
+        """
+        
+        rows, perm_probs = self._enumerate_permutations(max_outcomes)
+        perms = self._outcomes_frame(rows, perm_probs, rolls)
+        
+        return perms
+
+
+    def combo_counts(self, rolls=None, max_outcomes=1_000_000):
+        """
+        Compute the probability and expected count of every combination of
+        faces with nonzero probability. For identical dice each combination
+        is weighted by its multinomial coefficient, otherwise permutations
+        are enumerated and summed by combination.
+
+        Parameters
+        ----------
+        rolls : int, optional
+            Number of rolls to scale to. The default is None (rolls in the
+            last game played, or 1).
+        max_outcomes : int, optional
+            Largest number of outcomes to enumerate. The default is 1,000,000.
+
+        Returns
+        -------
+        combos : dataframe
+            A dataframe consisting of a MultiIndex of combinations with
+            probability and expected count columns.
+        
+        Raises
+        ------
+        ValueError
+            If there are more than max_outcomes outcomes to enumerate.
+        """
         
+        probs = self.game._probabilities()
+        n_dice = probs.shape[0]
         
+        # faces within a combination are sorted by value
+        order = self.game._face_order()
+        ranks = np.argsort(order)
+        
+        # if dice differ, sum probabilities of permutations with the same sorted faces
+        if not (probs == probs[0]).all():
+            rows, perm_probs = self._enumerate_permutations(max_outcomes)
+            rows, inverse = np.unique(np.sort(ranks[rows], axis=1), axis=0, return_inverse=True)
+            combo_probs = np.bincount(inverse.ravel(), weights=perm_probs)
+            
+            return self._outcomes_frame(order[rows], combo_probs, rolls)
+        
+        # identical dice, enumerate sorted combinations of faces that can be rolled
+        support = order[np.isin(order, np.flatnonzero(probs[0]))]
+        n_outcomes = math.comb(len(support) + n_dice - 1, n_dice)
+        if n_outcomes > max_outcomes:
+            raise ValueError(f'Game has {n_outcomes} combinations, more than max_outcomes={max_outcomes}.')
+        rows = np.array(list(itertools.combinations_with_replacement(support, n_dice)),
+                        dtype=np.intp).reshape(-1, n_dice)
+        
+        # multinomial probability from how often each face appears in a combination
+        counts = np.zeros((rows.shape[0], probs.shape[1]), dtype=np.intp)
+        for j in range(n_dice):
+            counts[np.arange(rows.shape[0]), rows[:, j]] += 1
+        log_fact = np.concatenate([[0.], np.cumsum(np.log(np.arange(1, n_dice+1)))])
+        log_p = np.log(probs[0], out=np.zeros_like(probs[0]), where=probs[0] > 0)
+        combo_probs = np.exp(log_fact[n_dice] - log_fact[counts].sum(axis=1) + counts @ log_p)
+        
+        combos = self._outcomes_frame(rows, combo_probs, rolls)
+        
+        return combos
+    
+    
     def __str__(self):
         """
         Create string representation of class to check for
@@ -368,54 +3391,66 @@ class Game:
 
         Returns
         -------
-        str rep of game object
+        str rep of exact analyzer object
         """
         
-        return 'Game'
+        return 'ExactAnalyzer'
 
 
-##################
-# ANALYZER CLASS #
-##################
+####################
+# EXPERIMENT CLASS #
+####################
 
 
-class Analyzer:
+class Experiment:
 
     """
-    A class used to analyze various descriptive statistical properties
-    from results of a single Game object.
+    A class used to run a sweep of Game configurations and compare their
+    statistics. Each configuration is played in chunks with its own seed
+    and only the requested statistics are kept, never full game results.
 
     Attributes
     ----------
-    game : Game class
-        A single game class with results from recent game play.
+    faces : numpy array
+        Faces of every die in every configuration.
+    grid : dict
+        Lists of values to sweep for 'dice' (number of dice), 'weights'
+        (None for fair dice or a mapping of face to weight) and 'rolls'.
+    stats : list
+        Names of statistics to collect, from 'jackpot_counts',
+        'jackpot_ratio', 'face_counts', 'combo_counts' and 'permutations'.
 
     Methods
     -------
     __init__():
-        Creates initial Analyzer class object with Game object.
-    jackpot_counts():
-        Returns an integer of number of jackpots (same face each roll).
-    face_counts():
-        Returns dataframe of number of times each face was rolled.
-    combo_counts():
-        Returns dataframe of number of distinct combinations of faces rolled.
-    permutations():
-        Returns dataframe of number of distinct permutations of faces rolled.
+        Creates initial class object with faces, sweep grid and statistics.
+    configs():
+        Returns list of every configuration in the sweep grid.
+    run():
+        Plays every configuration and returns tidy dataframe of statistics.
     __str__():
         Returns string representation of class object.
-    """    
+    """
 
+    __slots__ = ('faces', 'grid', 'stats')
     
-    def __init__(self, game):
+    
+    STATS = ['jackpot_counts', 'jackpot_ratio', 'face_counts', 'combo_counts', 'permutations']
+    
+    
+    def __init__(self, faces, grid, stats=('jackpot_ratio',)):
         """
-        Initialize an Analyzer object to perform statistics on Game results
-        Takes a game object as input parameter.
+        Initialize an Experiment object with a sweep grid.
 
         Parameters
         ----------
-        game : Game object
-            A valid Game object to perform summary statistics on.
+        faces : numpy array
+            Faces of every die, values must be distinct.
+        grid : dict
+            Lists of values to sweep for 'dice', 'weights' and 'rolls'.
+            'weights' may be left out for fair dice.
+        stats : list, optional
+            Names of statistics to collect. The default is ('jackpot_ratio',).
 
         Returns
         -------
@@ -423,134 +3458,285 @@ class Analyzer:
         
         Raises
         ------
+        TypeError
+            If faces is not a numpy array data type.
         ValueError
-            If given game parameter is not a Game type object.
+            If grid is missing 'dice' or 'rolls' or a statistic is unknown.
         """
         
-        # check that game is of game object data type
-        # try getting string representation of game class
-        try:
-            str(game)
-        # if can't get str of parameter, raise error that parameter may not be of game object type
-        except TypeError:
-            print('Cannot retrieve str rep of object. Make sure parameter is valid game object.')
-            
-        # raise ValueError if game is not of game object type 
-        if not str(game) == 'Game':
-            raise ValueError('Invalid game parameter. Must be of Game object type.')
-
-        # if no errors, assign game object to analyzer class
-        self.game = game
-
+        # return TypeError if not a numpy array
+        if not isinstance(faces, np.ndarray):
+            raise TypeError('Die faces must be of numpy array dtype.')
+        
+        # return ValueError if grid or stats are not valid
+        if 'dice' not in grid or 'rolls' not in grid:
+            raise ValueError('Grid must have lists of values for "dice" and "rolls".')
+        for stat in stats:
+            if stat not in self.STATS:
+                raise ValueError(f'Invalid statistic {stat!r}. Options are {self.STATS}.')
+        
+        # if no errors, assign faces, grid (fair dice by default) and stats
+        self.faces = faces
+        self.grid = dict(grid)
+        self.grid.setdefault('weights', [None])
+        self.stats = list(stats)
+        
         return
 
 
-    def jackpot_counts(self):
+    def configs(self):
         """
-        Compute how many times in a game a roll resulted in which all faces
-        were the same (e.g. all die rolled a one).
+        List every combination of values in the sweep grid.
+
+        Returns
+        -------
+        configs : list
+            A list of dicts with one value for each grid parameter.
+        """
+        
+        names = list(self.grid)
+        configs = [dict(zip(names, values))
+                   for values in itertools.product(*self.grid.values())]
         
+        return configs
+
+
+    def run(self, workers=None, seed=None, chunk_size=1_000_000):
+        """
+        Play every configuration in the sweep grid and collect statistics.
+        Each experiment gets a seed spawned from the given seed, so results
+        are the same for any number of workers.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes. The default is None (run in this
+            process).
+        seed : int, optional
+            Seed for the whole sweep. The default is None.
+        chunk_size : int, optional
+            Number of rolls per chunk. The default is 1,000,000.
+
         Returns
         -------
-        counts : int
-            The number of times a roll resulted in all the same faces (jackpot).
+        results : dataframe
+            Tidy dataframe with one row per experiment, statistic and
+            outcome, with columns for each grid parameter and the value.
         """
         
-        # get results of rolls from game object
-        results = self.game.show_results()
+        # give each configuration its own independent seed
+        configs = self.configs()
+        seeds = np.random.SeedSequence(seed).spawn(len(configs))
+        args = ([self.faces] * len(configs), configs, [self.stats] * len(configs),
+                [chunk_size] * len(configs), seeds)
         
-        # count the number of times rows had all the same values
-        jackpots = results[results.nunique(axis=1) == 1]
-        counts = int(jackpots.shape[0])
+        # run experiments in this process or across a pool
+        if workers is None:
+            outputs = list(map(_run_experiment, *args))
+        else:
+            with futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                outputs = list(pool.map(_run_experiment, *args))
         
-        # return total count of jackpots
-        return counts
+        # label each record with its experiment number and configuration
+        rows = [{'experiment': i, **config, **record}
+                for i, (config, records) in enumerate(zip(configs, outputs))
+                for record in records]
+        results = pd.DataFrame(rows, columns=['experiment', *self.grid, 'statistic', 'outcome', 'value'])
+        
+        # keep outcomes as given (faces or tuples of faces) rather than numbers
+        results['outcome'] = pd.Series([row['outcome'] for row in rows], index=results.index, dtype=object)
+        
+        return results
+    
+    
+    def __str__(self):
+        """
+        Create string representation of class to check for
+        class type in other objects
+
+        Returns
+        -------
+        str rep of experiment object
+        """
+        
+        return 'Experiment'
 
 
-    def face_counts(self):
+##################
+# PROFILER CLASS #
+##################
+
+
+class Profiler:
+
+    """
+    A class used to measure where time goes while dice are rolled, games
+    are played and results are analyzed. Used as a context manager; while
+    active, instrumented methods add their wall time to a phase and update
+    counters. No timing is done when no Profiler is active.
+
+    Phases are 'Die.roll_die', 'Game.play_game', 'Game.sample',
+    'Game.show_results', 'Game.decode', 'RunningAnalyzer.update',
+    'SketchAnalyzer.update' and one per Analyzer statistic (e.g.
+    'Analyzer.combo_counts'). Phase times
+    include time spent in phases they call. Counters are 'game_rolls',
+    'die_rolls', 'allocated_bytes' (game results), 'copies' and
+    'copied_bytes' (results and statistics copied for callers), and
+    'cache_hits' and 'cache_misses' (Analyzer statistics).
+
+    Attributes
+    ----------
+    timers : dict
+        Number of calls and total seconds for each phase.
+    counters : dict
+        Total of each counter.
+    callback : function
+        Called with the report when the context exits, or None.
+    _previous : Profiler
+        Private attribute for the profiler active before this one.
+
+    Methods
+    -------
+    __init__():
+        Creates initial Profiler class object with optional callback.
+    add():
+        Adds a value to a counter.
+    add_time():
+        Adds one timed call to a phase.
+    report():
+        Returns dict of phase timings and counters.
+    records():
+        Returns flat list of metric records from report.
+    __str__():
+        Returns string representation of class object.
+    """
+
+    __slots__ = ('timers', 'counters', 'callback', '_previous')
+    
+    
+    def __init__(self, callback=None):
         """
-        Compute the number of times each face was rolled in each round.
+        Initialize a Profiler object with no timings or counts.
+
+        Parameters
+        ----------
+        callback : function, optional
+            Function called with report() when the context exits, e.g. to
+            send metrics. The default is None.
 
         Returns
         -------
-        face_counts : dataframe
-            Dataframe consists of the roll number (rows), face values(columns)
-            and the number of times each face value occurred in each roll.
+        None.
         """
         
-        # get faces from dice
-        faces = self.game.dice[0].faces
-        
-        # get row value counts from results
-        results = self.game.show_results()
-        counts = results.apply(lambda row: row.value_counts(), axis=1).fillna(0).astype('int')
+        self.timers = {}
+        self.counters = {}
+        self.callback = callback
+        self._previous = None
         
-        # create new dataframe with faces as columns and face_counts as values
-        face_counts = pd.DataFrame(np.zeros((results.shape[0], len(faces)), dtype='int'),
-                                   index = results.index,
-                                   columns = faces)
+        return
+
+
+    def __enter__(self):
+        # make this the active profiler, restoring any outer one on exit
+        global _PROFILER
+        self._previous = _PROFILER
+        _PROFILER = self
         
-        # Create new dataframe with counts of each face for each roll
-        face_counts.update(counts)
+        return self
+
+
+    def __exit__(self, exc_type, exc, tb):
+        global _PROFILER
+        _PROFILER = self._previous
+        self._previous = None
+        if self.callback is not None:
+            self.callback(self.report())
         
-        # return counts of each face of die
-        return face_counts
+        return False
 
 
-    def combo_counts(self):
+    def add(self, counter, value=1):
         """
-        Computes the unique combinations of faces rolled along with the
-        number of times that unique combination occurred.
+        Add a value to a counter.
+
+        Parameters
+        ----------
+        counter : str
+            Name of the counter.
+        value : int, optional
+            Amount to add. The default is 1.
 
         Returns
         -------
-        combos : dataframe
-            A dataframe consists of a MultiIndex of distinct combinations
-            with a column associated with the number of counts.
+        None.
         """
+        
+        self.counters[counter] = self.counters.get(counter, 0) + int(value)
+        
+        return
 
-        # get results from game object
-        results = self.game.show_results()
 
-        # get all combinations of results and convert to sorted list
-        data = results.to_dict(orient='tight')['data']
-        combo_data = []
-        for d in data:
-            combo_data.append(sorted(d))
+    def add_time(self, phase, seconds):
+        """
+        Add one timed call to a phase.
 
-        # get value counts of all distinct combinations by sorting
-        # combinations and counting how many each combo was rolled
-        combo_counts = pd.DataFrame(sorted(combo_data)).value_counts()
-        combos = pd.DataFrame(combo_counts)
+        Parameters
+        ----------
+        phase : str
+            Name of the phase.
+        seconds : float
+            Wall time of the call.
 
-        # return dataframe with combos and counts
-        return combos
+        Returns
+        -------
+        None.
+        """
+        
+        calls, total = self.timers.get(phase, (0, 0.0))
+        self.timers[phase] = (calls + 1, total + seconds)
+        
+        return
 
 
-    def permutations(self):
+    def report(self):
         """
-        Computes unique permutations of faces rolled along with the number
-        of times that unique permutation occurred.
+        Summarize phase timings and counters.
 
         Returns
         -------
-        perms : dataframe
-            A dataframe consisting of a MultiIndex of distinct permutations
-            with a column associated with the number of counts.
+        report : dict
+            'phases' mapping each phase to its 'calls' and 'seconds', and
+            'counters' mapping each counter to its total.
         """
         
-        # get results from game object
-        results = self.game.show_results()
+        phases = {phase: {'calls': calls, 'seconds': total}
+                  for phase, (calls, total) in sorted(self.timers.items())}
+        report = {'phases': phases, 'counters': dict(sorted(self.counters.items()))}
         
-        # get all combinations of results and convert to list
-        data = results.to_dict(orient='tight')['data']
+        return report
+
+
+    def records(self):
+        """
+        Flatten the report into one record per metric, ready to be written
+        as JSON lines or sent to a metrics pipeline.
+
+        Returns
+        -------
+        records : list
+            Dicts with 'metric' (e.g. 'Game.play_game.seconds' or
+            'counters.die_rolls') and 'value'.
+        """
         
-        # get value counts of all distinct permutations
-        perm_counts = pd.DataFrame(data).value_counts()
-        perms = pd.DataFrame(perm_counts)
+        report = self.report()
+        records = [{'metric': f'{phase}.{stat}', 'value': value}
+                   for phase, stats in report['phases'].items()
+                   for stat, value in stats.items()]
+        records += [{'metric': f'counters.{counter}', 'value': value}
+                    for counter, value in report['counters'].items()]
         
-        # return dataframe with permutations and counts
-        return perms
+        return records
     
     
     def __str__(self):
@@ -560,7 +3746,7 @@ class Analyzer:
 
         Returns
         -------
-        str rep of analyzer object
+        str rep of profiler object
         """
         
-        return 'Analyzer'
+        return 'Profiler'